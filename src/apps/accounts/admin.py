@@ -7,4 +7,5 @@ class CredentialAdmin(admin.ModelAdmin):
 
 @admin.register(Profile)
 class ProfileAdmin(admin.ModelAdmin):
-    list_display = ("user", "patronymic")
+    list_display = ("user", "patronymic", "role", "extra_role_codes")
+    filter_horizontal = ("roles",)
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.accounts"
+
+    def ready(self):
+        from apps.core.instrumentation import register_component
+
+        from . import hashing, token_cache
+
+        register_component("token_cache", token_cache.cache_stats)
+        register_component("hash_pool", hashing.pool_stats)
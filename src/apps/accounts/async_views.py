@@ -0,0 +1,85 @@
+"""Async variants of the read-mostly auth endpoints (/api/auth/aio/...).
+
+DRF's APIView is sync-only, so under an ASGI server every call to the
+regular views is handed to a worker thread. These are native Django async
+views: together with the async path of JWTAuthMiddleware they issue their
+queries through the async ORM. Responses are byte-for-byte what the DRF
+views return.
+"""
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from . import revocation
+from .serializers import ProfileSerializer
+from .stateless import access_claims, aresolve_user
+from .utils import decode_token, make_access, make_refresh
+
+User = get_user_model()
+
+_JSON = {"ensure_ascii": False, "separators": (",", ":")}  # same bytes as DRF's JSONRenderer
+
+
+def _json(data, status: int = 200) -> JsonResponse:
+    return JsonResponse(data, status=status, json_dumps_params=_JSON)
+
+
+@require_GET
+async def whoami(request):
+    u = await request.auser()
+    # TokenUser.email would lazy-load the row synchronously
+    email = (await aresolve_user(u)).email if u.is_authenticated else None
+    return _json({
+        "has_authorization_header": bool(request.META.get("HTTP_AUTHORIZATION")),
+        "is_authenticated": bool(getattr(u, "is_authenticated", False)),
+        "user_id": getattr(u, "id", None),
+        "email": email,
+        "class": u.__class__.__name__ if u else None,
+    })
+
+
+@require_GET
+async def me(request):
+    u = await request.auser()
+    if not u.is_authenticated:
+        return _json({"detail": "Authentication credentials were not provided."}, status=403)
+    return _json(ProfileSerializer(await aresolve_user(u)).data)
+
+
+@csrf_exempt
+@require_POST
+async def refresh(request):
+    try:
+        data = json.loads(request.body or b"{}")
+    except ValueError:
+        data = {}
+    token = data.get("refresh") if isinstance(data, dict) else None
+    if not token:
+        return _json({"detail": "refresh токен обязателен"}, status=400)
+    try:
+        payload = decode_token(token)
+    except Exception:
+        return _json({"detail": "Неверный или истекший токен."}, status=401)
+    if payload.get("type") != "refresh":
+        return _json({"detail": "Неверный тип токена."}, status=400)
+    user = (
+        await User.objects.select_related("profile__role")
+        .filter(id=int(payload["sub"]), is_active=True)
+        .afirst()
+    )
+    if user is None:
+        return _json({"detail": "Пользователь не найден или деактивирован."}, status=401)
+    try:
+        # the revocation store is sync (bloom filter + rare DB writes)
+        family = await sync_to_async(revocation.rotate)(payload)
+    except revocation.TokenReuseDetected:
+        return _json({"detail": "Токен уже использован, сессия отозвана."}, status=401)
+    except revocation.TokenRevoked:
+        return _json({"detail": "Токен отозван."}, status=401)
+    return _json(
+        {"access": make_access(user.id, access_claims(user)), "refresh": make_refresh(user.id, family)}
+    )
@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from .utils import check_password
+
+User = get_user_model()
+
+
+class CredentialBackend(ModelBackend):
+    """Django auth backend (admin login) that verifies Credential.password_hash."""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        user = User.objects.select_related("cred").filter(**{User.USERNAME_FIELD: username}).first()
+        cred = getattr(user, "cred", None) if user else None
+        if cred is None:
+            return None
+        if check_password(password, cred.password_hash) and self.user_can_authenticate(user):
+            return user
+        return None
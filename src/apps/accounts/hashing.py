@@ -0,0 +1,122 @@
+"""Bounded worker pool for password hashing.
+
+bcrypt/PBKDF2 cost ~hundreds of ms of CPU each. Running them on the request
+thread lets a burst of logins occupy every worker; instead they go through a
+small executor (PASSWORD_HASH_WORKERS threads, at most PASSWORD_HASH_QUEUE
+waiting). When both are full the request fails fast with 503 + Retry-After.
+"""
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from apps.core.histogram import LatencyHistogram
+
+
+class HashPoolSaturated(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Сервис перегружен, повторите попытку позже."
+    default_code = "hash_pool_saturated"
+
+    def __init__(self, wait: int):
+        super().__init__()
+        self.wait = wait  # DRF turns this into the Retry-After header
+
+
+class HashPool:
+    def __init__(self, workers: int, queue_size: int, retry_after: int = 1):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pwhash")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._latency = defaultdict(LatencyHistogram)
+        self._rejected = defaultdict(int)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Calls holding a slot: running or waiting for a worker."""
+        return self._in_flight
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def run(self, op: str, fn, *args):
+        """Run fn(*args) on the pool and wait for it; raise HashPoolSaturated if full."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected[op] += 1
+            raise HashPoolSaturated(self.retry_after)
+        with self._lock:
+            self._in_flight += 1
+        start = time.perf_counter()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return future.result()
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._latency[op].observe(elapsed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            ops = set(self._latency) | set(self._rejected)
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "in_flight": self._in_flight,
+                "ops": {
+                    op: {**self._latency[op].snapshot(), "rejected": self._rejected[op]}
+                    for op in sorted(ops)
+                },
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _config() -> tuple:
+    return (
+        int(getattr(settings, "PASSWORD_HASH_WORKERS", 0) or os.cpu_count() or 2),
+        int(getattr(settings, "PASSWORD_HASH_QUEUE", 16)),
+        int(getattr(settings, "PASSWORD_HASH_RETRY_AFTER_SEC", 1)),
+    )
+
+
+def pool_stats() -> dict | None:
+    """stats() of this process's pool, or None before its first use."""
+    pool = _pool
+    return pool.stats() if pool is not None else None
+
+
+def get_hash_pool() -> HashPool:
+    """Process-wide pool, created lazily (after a pre-fork server forks)."""
+    global _pool
+    config = _config()
+    pool = _pool
+    if pool is None or (pool.workers, pool.queue_size, pool.retry_after) != config:
+        with _pool_lock:
+            if _pool is None or (_pool.workers, _pool.queue_size, _pool.retry_after) != config:
+                if _pool is not None:
+                    _pool.shutdown()
+                _pool = HashPool(*config)
+            pool = _pool
+    return pool
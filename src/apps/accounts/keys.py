@@ -0,0 +1,148 @@
+"""JWT signing/verification keys.
+
+settings.JWT_KEYS lists the keys, each a dict:
+
+    {"kid": "2024-10", "alg": "RS256" | "ES256" | "EdDSA" | "HS256",
+     "private_key": PEM | "private_key_file": path,   # signing key only
+     "public_key": PEM | "public_key_file": path,     # asymmetric
+     "secret": str}                                    # HMAC
+
+JWT_SIGNING_KID names the key new tokens are signed with (and stamped with
+in the "kid" header); every listed key verifies. Rotation: add the new key,
+switch JWT_SIGNING_KID, and drop the old one once its tokens have expired.
+Without JWT_KEYS a single HMAC key is built from JWT_SECRET/JWT_ALG, and
+tokens without a "kid" header are verified with it.
+
+PEMs are parsed once into key objects (the ring is rebuilt only when these
+settings change), so decode_token never parses key material per request.
+Asymmetric algorithms need the optional `cryptography` package.
+"""
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import jwt
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+HMAC_ALGS = {"HS256", "HS384", "HS512"}
+KEY_SETTINGS = {"JWT_KEYS", "JWT_SIGNING_KID", "JWT_SECRET", "JWT_ALG"}
+
+
+@dataclass(frozen=True)
+class Key:
+    kid: Optional[str]
+    alg: str
+    signing: Any  # parsed private key / secret; None for verify-only keys
+    verifying: Any  # parsed public key / secret
+
+    @property
+    def is_public(self) -> bool:
+        return self.alg not in HMAC_ALGS
+
+
+def _read(spec: dict, name: str) -> Optional[str]:
+    if spec.get(name):
+        return spec[name]
+    path = spec.get(f"{name}_file")
+    if path:
+        with open(path) as f:
+            return f.read()
+    return None
+
+
+def _build_key(spec: dict) -> Key:
+    kid, alg = spec.get("kid"), spec.get("alg", "RS256")
+    algorithms = jwt.algorithms.get_default_algorithms()
+    if alg not in algorithms:
+        raise ImproperlyConfigured(
+            f"JWT key {kid!r}: algorithm {alg} is unavailable (asymmetric keys need `cryptography`)"
+        )
+    algorithm = algorithms[alg]
+    if alg in HMAC_ALGS:
+        secret = algorithm.prepare_key(spec.get("secret") or "")
+        return Key(kid, alg, secret, secret)
+
+    private_pem, public_pem = _read(spec, "private_key"), _read(spec, "public_key")
+    private = algorithm.prepare_key(private_pem) if private_pem else None
+    if public_pem:
+        public = algorithm.prepare_key(public_pem)
+    elif private is not None:
+        public = private.public_key()
+    else:
+        raise ImproperlyConfigured(f"JWT key {kid!r} has neither a public nor a private key")
+    return Key(kid, alg, private, public)
+
+
+class KeyRing:
+    def __init__(self, keys: list, signing_kid: Optional[str]):
+        self.by_kid = {key.kid: key for key in keys}
+        try:
+            self.signing = self.by_kid[signing_kid]
+        except KeyError:
+            raise ImproperlyConfigured(f"JWT_SIGNING_KID {signing_kid!r} is not in JWT_KEYS") from None
+        if self.signing.signing is None:
+            raise ImproperlyConfigured(f"JWT signing key {signing_kid!r} has no private key")
+        self._jwks = None
+
+    @classmethod
+    def from_settings(cls) -> "KeyRing":
+        specs = getattr(settings, "JWT_KEYS", None)
+        if not specs:
+            specs = [{"kid": None, "alg": settings.JWT_ALG, "secret": settings.JWT_SECRET}]
+        keys = [_build_key(spec) for spec in specs]
+        default_kid = keys[0].kid if len(keys) == 1 else None
+        return cls(keys, getattr(settings, "JWT_SIGNING_KID", None) or default_kid)
+
+    def encode(self, payload: dict) -> str:
+        key = self.signing
+        headers = {"kid": key.kid} if key.kid is not None else None
+        return jwt.encode(payload, key.signing, algorithm=key.alg, headers=headers)
+
+    def decode(self, token: str) -> dict:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.by_kid.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown key id {kid!r}")
+        # the algorithm is pinned per key, never taken from the token
+        return jwt.decode(token, key.verifying, algorithms=[key.alg])
+
+    def jwks(self) -> tuple:
+        """(JSON bytes, ETag) of the public keys; HMAC secrets are never published."""
+        if self._jwks is None:
+            keys = []
+            for key in self.by_kid.values():
+                if not key.is_public:
+                    continue
+                algorithm = jwt.algorithms.get_default_algorithms()[key.alg]
+                jwk = algorithm.to_jwk(key.verifying, as_dict=True)
+                keys.append({**jwk, "kid": key.kid, "alg": key.alg, "use": "sig"})
+            body = json.dumps({"keys": keys}, separators=(",", ":"), sort_keys=True).encode()
+            self._jwks = (body, '"%s"' % hashlib.sha256(body).hexdigest()[:32])
+        return self._jwks
+
+
+_ring = None
+_lock = threading.Lock()
+
+
+def get_key_ring() -> KeyRing:
+    global _ring
+    ring = _ring
+    if ring is None:
+        with _lock:
+            if _ring is None:
+                _ring = KeyRing.from_settings()
+            ring = _ring
+    return ring
+
+
+@receiver(setting_changed)
+def _reset_key_ring(setting, **kwargs):
+    global _ring
+    if setting in KEY_SETTINGS:
+        _ring = None
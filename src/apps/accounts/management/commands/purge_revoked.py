@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.accounts.models import RevokedToken
+from apps.accounts.revocation import bucket_for
+
+
+class Command(BaseCommand):
+    help = "Delete revoked-token rows whose tokens have expired, a batch at a time"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--sleep", type=float, default=0.0, help="Pause between batches (seconds)"
+        )
+
+    def handle(self, *args, **kwargs):
+        batch_size, pause = kwargs["batch_size"], kwargs["sleep"]
+        # whole expired buckets only: the current one may still hold live rows
+        expired = RevokedToken.objects.filter(bucket__lt=bucket_for(timezone.now()))
+        total = 0
+        while True:
+            ids = list(expired.order_by("bucket").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            total += RevokedToken.objects.filter(id__in=ids).delete()[0]
+            if pause:
+                time.sleep(pause)
+        self.stdout.write(self.style.SUCCESS(f"Purged {total} expired revocations."))
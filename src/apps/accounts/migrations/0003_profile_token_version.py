@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-18 18:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_profile_role"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="token_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
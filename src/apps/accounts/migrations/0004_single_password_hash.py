@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import migrations
+
+
+def drop_duplicate_django_hashes(apps, schema_editor):
+    """Users that have a Credential keep it as their only password hash."""
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    users = (
+        User.objects.filter(cred__isnull=False)
+        .exclude(password="")
+        .exclude(password__startswith="!")
+        .only("id", "password")
+    )
+    batch = []
+    for user in users.iterator(chunk_size=1000):
+        user.password = make_password(None)
+        batch.append(user)
+        if len(batch) >= 1000:
+            User.objects.bulk_update(batch, ["password"])
+            batch = []
+    if batch:
+        User.objects.bulk_update(batch, ["password"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_profile_token_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_django_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+INDEX = models.Index(Lower("email"), name="accounts_user_email_lower_idx")
+
+
+def _user_model(apps):
+    return apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+
+
+def add_index(apps, schema_editor):
+    schema_editor.add_index(_user_model(apps), INDEX)
+
+
+def remove_index(apps, schema_editor):
+    schema_editor.remove_index(_user_model(apps), INDEX)
+
+
+class Migration(migrations.Migration):
+    """Functional LOWER(email) index on the user table for case-insensitive login.
+
+    The user model belongs to another app, so the index is created directly
+    through the schema editor rather than as a model Meta index. It has to run
+    after the last auth migration: SQLite rebuilds the table on AlterField and
+    drops indexes that the model state does not know about.
+    """
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("accounts", "0004_single_password_hash"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index),
+    ]
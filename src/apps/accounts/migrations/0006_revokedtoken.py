@@ -0,0 +1,36 @@
+# Generated by Django 5.0.7 on 2026-10-18 18:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_user_email_lower_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevokedToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=64, unique=True)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("jti", "token"), ("fam", "family")], max_length=3
+                    ),
+                ),
+                ("expires_at", models.DateTimeField()),
+                ("bucket", models.PositiveIntegerField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_revokedtoken"),
+        ("authz", "0002_role_parents"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="extra_role_codes",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="roles",
+            field=models.ManyToManyField(
+                blank=True, related_name="extra_profiles", to="authz.role"
+            ),
+        ),
+    ]
@@ -1,8 +1,12 @@
 from django.conf import settings
 from django.db import models
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Lower
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
 from django.dispatch import receiver
 
+from apps.authz.matrix import role_key
 from apps.authz.models import Role
 
 
@@ -29,18 +33,136 @@ class Profile(models.Model):
         blank=True,
         related_name="profiles",
     )
+    # Roles held on top of `role`. Their codes are copied to extra_role_codes
+    # (joined by "+") so the effective role resolves without a query.
+    roles = models.ManyToManyField(Role, blank=True, related_name="extra_profiles")
+    extra_role_codes = models.TextField(blank=True, default="", editable=False)
+    # Bumped whenever role or active state changes; stateless access tokens
+    # carry it as the "tv" claim and stop validating once it moves on.
+    token_version = models.PositiveIntegerField(default=0)
 
     def __str__(self) -> str:
         return f"profile:{self.user_id}"
 
 
+class RevokedToken(models.Model):
+    """A revoked refresh token ("jti") or a whole rotation family ("fam").
+
+    Rows are only needed until the token itself expires; `bucket` is the
+    expiry time in REVOCATION_BUCKET_SEC slots so purge_revoked can drop
+    whole expired slots through the index.
+    """
+
+    KIND_TOKEN = "jti"
+    KIND_FAMILY = "fam"
+    KINDS = [(KIND_TOKEN, "token"), (KIND_FAMILY, "family")]
+
+    key = models.CharField(max_length=64, unique=True)
+    kind = models.CharField(max_length=3, choices=KINDS)
+    expires_at = models.DateTimeField()
+    bucket = models.PositiveIntegerField(db_index=True)
+
+    def __str__(self) -> str:
+        return f"revoked:{self.kind}:{self.key}"
+
+
+def with_email_lower(queryset):
+    """Annotate email_lower = LOWER(email), the expression indexed by migration 0005."""
+    return queryset.annotate(email_lower=Lower("email"))
+
+
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def _ensure_profile(sender, instance, created, **kwargs):
     if created:
-        profile, _ = Profile.objects.get_or_create(user=instance)
-        if profile.role_id is None:
-            try:
-                profile.role = Role.objects.get(code="user")
-                profile.save(update_fields=["role"])
-            except Role.DoesNotExist:
-                pass
+        role = Role.objects.filter(code="user").first()
+        profile, made = Profile.objects.get_or_create(user=instance, defaults={"role": role})
+        if not made and profile.role_id is None and role is not None:
+            profile.role = role
+            profile.save(update_fields=["role"])
+
+
+@transaction.atomic
+def migrate_to_credential(user, password_hash: str) -> None:
+    """Make Credential the single password hash of a legacy user."""
+    Credential.objects.update_or_create(user=user, defaults={"password_hash": password_hash})
+    user.set_unusable_password()
+    user.save(update_fields=["password"])
+
+
+def bump_token_version(user_id) -> None:
+    from .stateless import forget_token_version
+
+    Profile.objects.filter(user_id=user_id).update(token_version=F("token_version") + 1)
+    transaction.on_commit(lambda: forget_token_version(user_id))
+
+
+# The loaded values are read from __dict__ so deferred fields are not fetched.
+_UNKNOWN = object()
+
+
+@receiver(post_init, sender=Profile)
+def _remember_role(sender, instance, **kwargs):
+    instance._loaded_role_id = instance.__dict__.get("role_id", _UNKNOWN)
+
+
+@receiver(post_save, sender=Profile)
+def _role_changed(sender, instance, created, **kwargs):
+    loaded = instance._loaded_role_id
+    if not created and loaded is not _UNKNOWN and instance.role_id != loaded:
+        bump_token_version(instance.user_id)
+    instance._loaded_role_id = instance.role_id
+
+
+def _sync_extra_roles(profile_ids) -> dict:
+    """Recopy Profile.roles codes into extra_role_codes; expires tokens of changed profiles."""
+    synced = {}
+    for profile in Profile.objects.filter(pk__in=list(profile_ids)).prefetch_related("roles"):
+        codes = role_key(*(role.code for role in profile.roles.all())) or ""
+        if codes != profile.extra_role_codes:
+            Profile.objects.filter(pk=profile.pk).update(extra_role_codes=codes)
+            bump_token_version(profile.user_id)
+        synced[profile.pk] = codes
+    return synced
+
+
+@receiver(m2m_changed, sender=Profile.roles.through)
+def _extra_roles_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        instance._clearing_profiles = list(instance.extra_profiles.values_list("pk", flat=True))
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        instance.extra_role_codes = _sync_extra_roles([instance.pk]).get(instance.pk, "")
+    elif action == "post_clear":
+        _sync_extra_roles(instance.__dict__.pop("_clearing_profiles", []))
+    else:
+        _sync_extra_roles(pk_set)
+
+
+@receiver(post_save, sender=Role)
+def _role_renamed(sender, instance, created, **kwargs):
+    if not created:
+        _sync_extra_roles(Profile.objects.filter(roles=instance).values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Role)
+def _remember_role_holders(sender, instance, **kwargs):
+    instance._extra_profiles = list(instance.extra_profiles.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Role)
+def _role_deleted(sender, instance, **kwargs):
+    _sync_extra_roles(getattr(instance, "_extra_profiles", []))
+
+
+@receiver(post_init, sender=settings.AUTH_USER_MODEL)
+def _remember_active(sender, instance, **kwargs):
+    instance._loaded_is_active = instance.__dict__.get("is_active", _UNKNOWN)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def _active_changed(sender, instance, created, **kwargs):
+    loaded = instance._loaded_is_active
+    if not created and loaded is not _UNKNOWN and instance.is_active != loaded:
+        bump_token_version(instance.pk)
+    instance._loaded_is_active = instance.is_active
@@ -0,0 +1,190 @@
+"""Refresh-token rotation and revocation.
+
+Every refresh token carries a "jti" and the id of its rotation family
+("fam", shared by all tokens descending from one login). Using a refresh
+token revokes its jti and issues the next token of the family; presenting
+an already used jti again means the token leaked, so the whole family is
+revoked. Logout revokes the family.
+
+Revocations are rows of RevokedToken. Each process mirrors them in a bloom
+filter and asks the database only when the filter says "maybe", so checking
+a token that was not revoked costs no query. New rows reach other workers
+through a change counter in the Django cache: when it moved, the process
+pulls rows above its id watermark.
+"""
+import datetime as dt
+import hashlib
+import logging
+import math
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from apps.core.counters import bump_counter
+
+from .models import RevokedToken
+
+log = logging.getLogger(__name__)
+
+COUNTER_KEY = "accounts:revoked:counter"
+
+
+class TokenReuseDetected(Exception):
+    pass
+
+
+class TokenRevoked(Exception):
+    pass
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        changed = False
+        for pos in self._positions(key):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                changed = True
+        self.count += changed  # re-adding a known key doesn't count
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+def bucket_for(expires_at: dt.datetime) -> int:
+    return int(expires_at.timestamp()) // int(getattr(settings, "REVOCATION_BUCKET_SEC", 3600))
+
+
+class RevocationStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._watermark = 0
+        self._counter = None
+        self.db_checks = 0
+
+    def _rebuild(self) -> None:
+        capacity = int(getattr(settings, "REVOCATION_BLOOM_CAPACITY", 100_000))
+        rows = list(
+            RevokedToken.objects.filter(expires_at__gt=timezone.now()).values_list("id", "key")
+        )
+        error_rate = float(getattr(settings, "REVOCATION_BLOOM_ERROR_RATE", 0.001))
+        bloom = BloomFilter(max(capacity, 2 * len(rows)), error_rate)
+        for _, key in rows:
+            bloom.add(key)
+        self._bloom = bloom
+        self._watermark = max((row_id for row_id, _ in rows), default=self._watermark)
+
+    def _sync(self) -> None:
+        counter = cache.get(COUNTER_KEY)
+        with self._lock:
+            if self._bloom is None:
+                self._counter = counter
+                self._rebuild()
+                return
+            if counter == self._counter:
+                return
+            self._counter = counter
+            # ids commit out of order; look back a little so a late commit
+            # below the watermark isn't skipped
+            lookback = int(getattr(settings, "REVOCATION_SYNC_LOOKBACK", 100))
+            rows = RevokedToken.objects.filter(id__gt=self._watermark - lookback).values_list("id", "key")
+            for row_id, key in rows:
+                self._bloom.add(key)
+                self._watermark = max(self._watermark, row_id)
+            if self._bloom.count > self._bloom.capacity:
+                self._rebuild()
+
+    def is_revoked(self, *keys: str) -> bool:
+        self._sync()
+        maybe = [key for key in keys if key in self._bloom]
+        if not maybe:
+            return False
+        self.db_checks += 1
+        return RevokedToken.objects.filter(key__in=maybe).exists()
+
+    def revoke(self, key: str, kind: str, expires_at: dt.datetime) -> bool:
+        """Store the revocation; False if `key` was already revoked."""
+        try:
+            with transaction.atomic():
+                row = RevokedToken.objects.create(
+                    key=key, kind=kind, expires_at=expires_at, bucket=bucket_for(expires_at)
+                )
+        except IntegrityError:
+            return False
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(key)
+        transaction.on_commit(_publish)
+        log.debug("revoked %s %s (id=%s)", kind, key, row.id)
+        return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bloom = None
+            self._watermark = 0
+            self._counter = None
+
+
+def _publish() -> None:
+    try:
+        bump_counter(cache, COUNTER_KEY)
+    except Exception:
+        log.warning("failed to publish token revocation", exc_info=True)
+
+
+_store = RevocationStore()
+
+
+def get_store() -> RevocationStore:
+    return _store
+
+
+def _expiry(payload) -> dt.datetime:
+    return dt.datetime.fromtimestamp(payload["exp"], tz=dt.timezone.utc)
+
+
+def rotate(payload) -> str:
+    """Consume a decoded refresh token; returns the family for the next token.
+
+    Raises TokenRevoked for revoked tokens/families and TokenReuseDetected
+    (after revoking the family) when the token was already used.
+    """
+    jti, family = payload.get("jti"), payload.get("fam")
+    if not jti or not family:
+        raise TokenRevoked("refresh token without jti")
+    store = get_store()
+    if store.is_revoked(family):
+        raise TokenRevoked(family)
+    expires_at = _expiry(payload)
+    if not store.revoke(jti, RevokedToken.KIND_TOKEN, expires_at):
+        store.revoke(family, RevokedToken.KIND_FAMILY, _family_expiry())
+        raise TokenReuseDetected(family)
+    return family
+
+
+def _family_expiry() -> dt.datetime:
+    # no member of the family outlives the refresh TTL from now
+    return timezone.now() + dt.timedelta(days=int(getattr(settings, "JWT_REFRESH_TTL_DAYS", 7)))
+
+
+def revoke_family(payload) -> None:
+    family = payload.get("fam")
+    if family:
+        get_store().revoke(family, RevokedToken.KIND_FAMILY, _family_expiry())
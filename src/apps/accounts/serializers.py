@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from .models import Credential
+from .models import Credential, with_email_lower
 
 User = get_user_model()
 
@@ -15,7 +15,8 @@ class RegisterSerializer(serializers.Serializer):
     def validate(self, data):
         if data["password"] != data["password2"]:
             raise serializers.ValidationError("Пароли не совпадают.")
-        if User.objects.filter(email=data["email"]).exists():
+        email_lower = data["email"].strip().lower()
+        if with_email_lower(User.objects).filter(email_lower=email_lower).exists():
             raise serializers.ValidationError("Пользователь с таким email уже есть.")
         return data
 
@@ -0,0 +1,107 @@
+"""Stateless access tokens (settings.JWT_STATELESS_ACCESS).
+
+Access tokens additionally carry the role code ("role") and the profile's
+token_version ("tv"). The middleware then authenticates from the claims alone,
+checking "tv" against a cached user_id -> version map instead of loading the
+user row. Bumping Profile.token_version (role change, deactivation) makes
+every outstanding access token of that user invalid.
+"""
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from apps.authz.permissions import get_user_role
+
+User = get_user_model()
+
+VERSION_KEY = "accounts:tv:{}"
+# cached for users that are gone or deactivated; never equals a claim
+NO_VERSION = -1
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, "JWT_STATELESS_ACCESS", False))
+
+
+def access_claims(user) -> dict:
+    """Extra claims for make_access(); empty unless stateless mode is on."""
+    if not is_enabled():
+        return {}
+    return {"role": get_user_role(user), "tv": user.profile.token_version}
+
+
+def _version_query(user_id: int):
+    from .models import Profile
+
+    return Profile.objects.filter(user_id=user_id).values_list("token_version", "user__is_active")
+
+
+def get_token_version(user_id: int) -> int:
+    key = VERSION_KEY.format(user_id)
+    version = cache.get(key)
+    if version is None:
+        row = _version_query(user_id).first()
+        version = row[0] if row and row[1] else NO_VERSION
+        cache.set(key, version, getattr(settings, "JWT_TOKEN_VERSION_CACHE_SEC", 300))
+    return version
+
+
+async def aget_token_version(user_id: int) -> int:
+    key = VERSION_KEY.format(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        row = await _version_query(user_id).afirst()
+        version = row[0] if row and row[1] else NO_VERSION
+        await cache.aset(key, version, getattr(settings, "JWT_TOKEN_VERSION_CACHE_SEC", 300))
+    return version
+
+
+def forget_token_version(user_id: int) -> None:
+    cache.delete(VERSION_KEY.format(user_id))
+
+
+class TokenUser:
+    """Authenticated user built from access token claims.
+
+    id and role_code come from the token; any other attribute loads the
+    user row on first use. Code that saves the user must go through
+    resolve_user().
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    def __init__(self, user_id: int, role_code: Optional[str]):
+        self.id = self.pk = user_id
+        self.role_code = role_code
+        self._user = None
+
+    def get_user(self):
+        if self._user is None:
+            self._user = User.objects.select_related("profile__role").get(pk=self.id)
+        return self._user
+
+    async def aget_user(self):
+        if self._user is None:
+            self._user = await User.objects.select_related("profile__role").aget(pk=self.id)
+        return self._user
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.get_user(), name)
+
+    def __str__(self) -> str:
+        return f"token-user:{self.id}"
+
+
+def resolve_user(user):
+    """The model instance behind request.user."""
+    return user.get_user() if isinstance(user, TokenUser) else user
+
+
+async def aresolve_user(user):
+    return await user.aget_user() if isinstance(user, TokenUser) else user
@@ -0,0 +1,108 @@
+"""Bounded LRU of verified JWT payloads, keyed by the token's SHA-256 digest.
+
+A client reuses its access token for JWT_ACCESS_TTL_MIN minutes; verifying
+the signature once per token instead of once per request takes decode_token
+off the hot path. Entries expire at the token's own "exp". Tokens that fail
+verification are remembered for JWT_DECODE_NEGATIVE_TTL_SEC so floods of
+garbage bearer tokens are rejected without re-parsing them.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
+import jwt
+from django.conf import settings
+
+from .utils import decode_token
+
+
+class DecodedTokenCache:
+    def __init__(self, maxsize: int = 4096, negative_ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self._entries = OrderedDict()  # digest -> (payload | None, expires_at)
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.negative_hits = 0
+
+    def decode(self, token: str):
+        """Verified payload (read-only mapping); raises jwt.InvalidTokenError."""
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                payload, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    if payload is None:
+                        self.negative_hits += 1
+                        raise jwt.InvalidTokenError("Token rejected (cached)")
+                    self.hits += 1
+                    return payload
+                del self._entries[key]
+            self.misses += 1
+
+        try:
+            payload = decode_token(token)
+        except jwt.InvalidTokenError:
+            if self.negative_ttl > 0:
+                self._store(key, None, now + self.negative_ttl)
+            raise
+
+        payload = MappingProxyType(payload)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            self._store(key, payload, exp)
+        return payload
+
+    def _store(self, key, payload, expires_at) -> None:
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> DecodedTokenCache | None:
+    """Process-wide cache, or None when JWT_DECODE_CACHE_SIZE is 0."""
+    global _cache
+    size = int(getattr(settings, "JWT_DECODE_CACHE_SIZE", 4096))
+    if size <= 0:
+        return None
+    if _cache is None or _cache.maxsize != size:
+        with _cache_lock:
+            if _cache is None or _cache.maxsize != size:
+                _cache = DecodedTokenCache(
+                    size, float(getattr(settings, "JWT_DECODE_NEGATIVE_TTL_SEC", 5))
+                )
+    return _cache
+
+
+def cache_stats() -> dict | None:
+    """stats() of this process's cache, or None before its first use."""
+    cache = _cache
+    return cache.stats() if cache is not None else None
+
+
+def decode_token_cached(token: str):
+    cache = get_token_cache()
+    return cache.decode(token) if cache is not None else decode_token(token)
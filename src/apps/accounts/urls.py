@@ -1,6 +1,7 @@
 from django.urls import path
 from .views import RegisterView, LoginView, RefreshView, LogoutView, MeView
-from .views import WhoAmIView
+from .views import JWKSView, WhoAmIView
+from . import async_views
 
 urlpatterns = [
     path("register", RegisterView.as_view()),
@@ -8,6 +9,11 @@ urlpatterns = [
     path("refresh",  RefreshView.as_view()),
     path("logout",   LogoutView.as_view()),
     path("users/me", MeView.as_view()),
-    path("whoami", WhoAmIView.as_view())
+    path("whoami", WhoAmIView.as_view()),
+    path("jwks", JWKSView.as_view()),
+    # native async variants (no thread hop under ASGI)
+    path("aio/whoami", async_views.whoami),
+    path("aio/users/me", async_views.me),
+    path("aio/refresh", async_views.refresh),
 ]
 
@@ -1,36 +1,159 @@
 import bcrypt
 import datetime as dt
-import jwt
+import hashlib
+import hmac
+import secrets
+import uuid
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
-def hash_password(plain: str) -> str:
-    return bcrypt.hashpw(plain.encode(), bcrypt.gensalt()).decode()
+from .keys import get_key_ring
+
+try:
+    import argon2
+except ImportError:  # optional: pip install argon2-cffi
+    argon2 = None
+
+
+class BcryptHasher:
+    name = "bcrypt"
+
+    def rounds(self) -> int:
+        return int(getattr(settings, "BCRYPT_ROUNDS", 12))
+
+    def encode(self, plain: str) -> str:
+        return bcrypt.hashpw(plain.encode(), bcrypt.gensalt(rounds=self.rounds())).decode()
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        return bcrypt.checkpw(plain.encode(), hashed.encode())
+
+    def matches(self, hashed: str) -> bool:
+        return hashed.startswith("$2")
+
+    def needs_rehash(self, hashed: str) -> bool:
+        # $2b$<rounds>$<salt+hash>
+        return int(hashed.split("$")[2]) != self.rounds()
+
+
+class Argon2Hasher:
+    """Memory-hard argon2id; parameters from ARGON2_TIME_COST/MEMORY_COST/PARALLELISM."""
+    name = "argon2"
+
+    def _hasher(self):
+        if argon2 is None:
+            raise ImproperlyConfigured("argon2 hasher requires the argon2-cffi package")
+        defaults = argon2.PasswordHasher()
+        return argon2.PasswordHasher(
+            time_cost=int(getattr(settings, "ARGON2_TIME_COST", defaults.time_cost)),
+            memory_cost=int(getattr(settings, "ARGON2_MEMORY_COST", defaults.memory_cost)),
+            parallelism=int(getattr(settings, "ARGON2_PARALLELISM", defaults.parallelism)),
+        )
+
+    def encode(self, plain: str) -> str:
+        return self._hasher().hash(plain)
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        try:
+            return self._hasher().verify(hashed, plain)
+        except argon2.exceptions.VerificationError:
+            return False
+
+    def matches(self, hashed: str) -> bool:
+        return hashed.startswith("$argon2")
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return self._hasher().check_needs_rehash(hashed)
+
+
+class FastHasher:
+    """Single salted SHA-256. Tests and local seeding only, never production."""
+    name = "fast"
+
+    def encode(self, plain: str) -> str:
+        salt = secrets.token_hex(8)
+        return f"fast${salt}${hashlib.sha256((salt + plain).encode()).hexdigest()}"
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        _, salt, digest = hashed.split("$", 2)
+        expected = hashlib.sha256((salt + plain).encode()).hexdigest()
+        return hmac.compare_digest(digest, expected)
+
+    def matches(self, hashed: str) -> bool:
+        return hashed.startswith("fast$")
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return False
+
+
+HASHERS = {h.name: h for h in (BcryptHasher, Argon2Hasher, FastHasher)}
+
+
+def _enabled_hashers() -> list:
+    """CREDENTIAL_HASHERS in order; the first one hashes new passwords."""
+    names = getattr(settings, "CREDENTIAL_HASHERS", None) or ["bcrypt"]
+    try:
+        return [HASHERS[name]() for name in names]
+    except KeyError as e:
+        raise ImproperlyConfigured(f"Unknown credential hasher {e}") from None
+
+
+def get_hasher(name: str | None = None):
+    if name is None:
+        return _enabled_hashers()[0]
+    if name not in HASHERS:
+        raise ImproperlyConfigured(f"Unknown credential hasher '{name}'")
+    return HASHERS[name]()
+
+
+def identify_hasher(hashed: str):
+    """Enabled hasher that produced `hashed`, or None."""
+    for hasher in _enabled_hashers():
+        if hasher.matches(hashed):
+            return hasher
+    return None
+
+
+def hash_password(plain: str, hasher: str | None = None) -> str:
+    return get_hasher(hasher).encode(plain)
 
 def check_password(plain: str, hashed: str) -> bool:
     try:
-        return bcrypt.checkpw(plain.encode(), hashed.encode())
+        hasher = identify_hasher(hashed)
+        return hasher is not None and hasher.verify(plain, hashed)
+    except ImproperlyConfigured:
+        raise
     except Exception:
         return False
 
+def needs_rehash(hashed: str) -> bool:
+    """True when `hashed` is not from the preferred hasher with current parameters."""
+    preferred = get_hasher()
+    return not preferred.matches(hashed) or preferred.needs_rehash(hashed)
+
 def _now_utc():
     return dt.datetime.now(dt.timezone.utc)
 
-def make_token(user_id: int, ttl_minutes: int, token_type: str = "access") -> str:
+def make_token(
+    user_id: int, ttl_minutes: int, token_type: str = "access", claims: dict | None = None
+) -> str:
     payload = {
+        **(claims or {}),
         "sub": str(user_id),
         "type": token_type,
         "iat": int(_now_utc().timestamp()),
         "exp": int((_now_utc() + dt.timedelta(minutes=ttl_minutes)).timestamp()),
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALG)
+    return get_key_ring().encode(payload)
 
-def make_access(user_id: int) -> str:
+def make_access(user_id: int, claims: dict | None = None) -> str:
     ttl = int(getattr(settings, "JWT_ACCESS_TTL_MIN", 15))
-    return make_token(user_id, ttl, "access")
+    return make_token(user_id, ttl, "access", claims)
 
-def make_refresh(user_id: int) -> str:
+def make_refresh(user_id: int, family: str | None = None) -> str:
+    """Refresh token with its own "jti", in rotation family `family` (new if None)."""
     days = int(getattr(settings, "JWT_REFRESH_TTL_DAYS", 7))
-    return make_token(user_id, days * 24 * 60, "refresh")
+    claims = {"jti": uuid.uuid4().hex, "fam": family or uuid.uuid4().hex}
+    return make_token(user_id, days * 24 * 60, "refresh", claims)
 
 def decode_token(token: str) -> dict:
-    return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
+    return get_key_ring().decode(token)
@@ -1,13 +1,21 @@
 # src/apps/accounts/views.py
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.exceptions import MultipleObjectsReturned
+from django.contrib.auth.hashers import check_password as django_check_password
 from django.db import transaction
+from django.db.models import Q
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status, permissions
 from rest_framework.permissions import AllowAny
 
-from .models import Credential
+from . import revocation
+from .keys import get_key_ring
+from .hashing import get_hash_pool
+from .models import Credential, migrate_to_credential, with_email_lower
+from .stateless import access_claims, resolve_user
 from .serializers import RegisterSerializer, LoginSerializer, ProfileSerializer
 from .utils import (
     hash_password,
@@ -15,6 +23,7 @@ from .utils import (
     make_access,
     make_refresh,
     decode_token,
+    needs_rehash,
 )
 
 User = get_user_model()
@@ -23,29 +32,31 @@ User = get_user_model()
 class RegisterView(APIView):
     permission_classes = [permissions.AllowAny]
 
-    @transaction.atomic
     def post(self, request):
         s = RegisterSerializer(data=request.data)
         s.is_valid(raise_exception=True)
         data = s.validated_data
 
-        user = User.objects.create(
-            username=data["email"],
-            email=data["email"].strip().lower(),
-            first_name=data.get("first_name", ""),
-            last_name=data.get("last_name", ""),
-            is_active=True,
-        )
-        user.set_password(data["password"])  # для админки/стандарта Django
-        user.save(update_fields=["password"])
-
-        Credential.objects.update_or_create(
-            user=user, defaults={"password_hash": hash_password(data["password"])}
-        )
+        # Credential.password_hash is the only password hash; the Django
+        # password stays unusable (admin logins go through CredentialBackend).
+        # Hash before opening the transaction so it is not held for the KDF.
+        password_hash = get_hash_pool().run("hash", hash_password, data["password"])
+
+        with transaction.atomic():
+            user = User(
+                username=data["email"],
+                email=data["email"].strip().lower(),
+                first_name=data.get("first_name", ""),
+                last_name=data.get("last_name", ""),
+                is_active=True,
+            )
+            user.set_unusable_password()
+            user.save()
+            Credential.objects.create(user=user, password_hash=password_hash)
 
-        if hasattr(user, "profile") and data.get("patronymic"):
-            user.profile.patronymic = data["patronymic"]
-            user.profile.save(update_fields=["patronymic"])
+            if hasattr(user, "profile") and data.get("patronymic"):
+                user.profile.patronymic = data["patronymic"]
+                user.profile.save(update_fields=["patronymic"])
 
         return Response({"id": user.id, "email": user.email}, status=status.HTTP_201_CREATED)
 
@@ -63,35 +74,43 @@ class LoginView(APIView):
         identity = (identity or "").strip()
         identity_l = identity.lower()
 
-        try:
-            user = (
-                    User.objects.filter(email__iexact=identity_l).first()
-                    or User.objects.filter(username=identity).first()
-            )
-        except MultipleObjectsReturned:
-            return Response({"detail": "Неверные учетные данные."}, status=400)
+        # one query: user + credential (+ profile/role for the token claims);
+        # LOWER(email) is served by accounts_user_email_lower_idx
+        candidates = list(
+            with_email_lower(User.objects.select_related("cred", "profile__role"))
+            .filter(Q(email_lower=identity_l) | Q(username=identity))
+            .order_by("pk")
+        )
+        user = next((u for u in candidates if u.email_lower == identity_l), None) or next(
+            (u for u in candidates if u.username == identity), None
+        )
 
         if not user or not user.is_active:
             return Response({"detail": "Неверные учетные данные."}, status=400)
 
+        # Exactly one hash is verified: the Credential, or for legacy users
+        # without one the Django password, which is then moved over.
         ok = False
+        pool = get_hash_pool()
         cred = getattr(user, "cred", None)
         if cred and cred.password_hash:
-            try:
-                ok = cred_check_password(password, cred.password_hash)
-            except Exception:
-                ok = False
-
-        if not ok and user.password:
-            try:
-                ok = user.check_password(password)
-            except Exception:
-                ok = False
+            ok = pool.run("check", cred_check_password, password, cred.password_hash)
+            if ok and needs_rehash(cred.password_hash):
+                # outdated cost/algorithm: upgrade while we know the password
+                cred.password_hash = pool.run("hash", hash_password, password)
+                cred.save(update_fields=["password_hash"])
+        elif user.password and user.has_usable_password():
+            ok = pool.run("django_check", django_check_password, password, user.password)
+            if ok:
+                migrate_to_credential(user, pool.run("hash", hash_password, password))
 
         if not ok:
             return Response({"detail": "Неверные учетные данные."}, status=400)
 
-        return Response({"access": make_access(user.id), "refresh": make_refresh(user.id)}, status=200)
+        return Response(
+            {"access": make_access(user.id, access_claims(user)), "refresh": make_refresh(user.id)},
+            status=200,
+        )
 
 
 class RefreshView(APIView):
@@ -112,11 +131,28 @@ class RefreshView(APIView):
             user = User.objects.get(id=user_id, is_active=True)
         except User.DoesNotExist:
             return Response({"detail": "Пользователь не найден или деактивирован."}, status=401)
-        return Response({"access": make_access(user.id)})
+        try:
+            family = revocation.rotate(payload)
+        except revocation.TokenReuseDetected:
+            return Response({"detail": "Токен уже использован, сессия отозвана."}, status=401)
+        except revocation.TokenRevoked:
+            return Response({"detail": "Токен отозван."}, status=401)
+        return Response(
+            {"access": make_access(user.id, access_claims(user)), "refresh": make_refresh(user.id, family)}
+        )
 
 
 class LogoutView(APIView):
     def post(self, request):
+        # revokes the session (refresh token family) when one is given
+        token = request.data.get("refresh")
+        if token:
+            try:
+                payload = decode_token(token)
+            except Exception:
+                payload = None
+            if payload and payload.get("type") == "refresh":
+                revocation.revoke_family(payload)
         return Response({"detail": "ok"})
 
 
@@ -124,16 +160,18 @@ class MeView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        return Response(ProfileSerializer(request.user).data)
+        return Response(ProfileSerializer(resolve_user(request.user)).data)
 
     def patch(self, request):
-        s = ProfileSerializer(instance=request.user, data=request.data, partial=True)
+        user = resolve_user(request.user)
+        s = ProfileSerializer(instance=user, data=request.data, partial=True)
         s.is_valid(raise_exception=True)
         s.save()
-        return Response(ProfileSerializer(request.user).data)
+        return Response(ProfileSerializer(user).data)
 
     def delete(self, request):
-        u = request.user
+        # deactivation bumps the token version, see apps.accounts.models
+        u = resolve_user(request.user)
         u.is_active = False
         u.save(update_fields=["is_active"])
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -150,4 +188,22 @@ class WhoAmIView(APIView):
             "user_id": getattr(u, "id", None),
             "email": getattr(u, "email", None),
             "class": u.__class__.__name__ if u else None,
-        })
\ No newline at end of file
+        })
+
+
+class JWKSView(APIView):
+    """Public verification keys (RFC 7517 key set) for other services and proxies."""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        body, etag = get_key_ring().jwks()
+        response = get_conditional_response(request, etag=etag) or HttpResponse(
+            body, content_type="application/jwk-set+json"
+        )
+        response["ETag"] = etag
+        patch_cache_control(
+            response, public=True, max_age=int(getattr(settings, "JWKS_MAX_AGE_SEC", 300))
+        )
+        return response
@@ -7,6 +7,7 @@ from .models import AccessRoleRule, BusinessElement, Role
 class RoleAdmin(admin.ModelAdmin):
     list_display = ("id", "code", "name")
     search_fields = ("code", "name")
+    filter_horizontal = ("parents",)
 
 
 @admin.register(BusinessElement)
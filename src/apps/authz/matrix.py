@@ -0,0 +1,185 @@
+import enum
+import logging
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.core.counters import bump_counter
+
+from .models import ROLE_SEPARATOR, AccessRoleRule, BusinessElement, Role
+
+log = logging.getLogger(__name__)
+
+GENERATION_KEY = "authz:rules:generation"
+
+
+class Perm(enum.IntFlag):
+    READ = 1
+    READ_ALL = 2
+    CREATE = 4
+    UPDATE = 8
+    UPDATE_ALL = 16
+    DELETE = 32
+    DELETE_ALL = 64
+
+
+# AccessRoleRule boolean field -> compiled flag
+RULE_FIELDS = {
+    "read_permission": Perm.READ,
+    "read_all_permission": Perm.READ_ALL,
+    "create_permission": Perm.CREATE,
+    "update_permission": Perm.UPDATE,
+    "update_all_permission": Perm.UPDATE_ALL,
+    "delete_permission": Perm.DELETE,
+    "delete_all_permission": Perm.DELETE_ALL,
+}
+
+
+# distinct role combinations remembered per snapshot
+MAX_COMBINATIONS = 4096
+
+
+def role_key(*parts: Optional[str]) -> Optional[str]:
+    """Canonical key of a set of roles: codes sorted and joined by "+"."""
+    codes = {code for part in parts if part for code in part.split(ROLE_SEPARATOR) if code}
+    return ROLE_SEPARATOR.join(sorted(codes)) or None
+
+
+def _merge(rule_sets) -> dict:
+    merged = {}
+    for rules in rule_sets:
+        for element_code, flags in rules.items():
+            merged[element_code] = merged.get(element_code, Perm(0)) | flags
+    return merged
+
+
+def _closure(role_code: str, parents: dict) -> set:
+    seen, stack = {role_code}, [role_code]
+    while stack:
+        for parent in parents.get(stack.pop(), ()):
+            if parent not in seen:
+                seen.add(parent)
+                stack.append(parent)
+    return seen
+
+
+class RuleMatrix:
+    """Immutable snapshot of effective permissions: role_code -> {element_code: Perm}.
+
+    A role's flags are the OR of its own rules and those of every role it
+    inherits from, resolved when the snapshot is built, so a lookup costs
+    the same however deep the hierarchy. A combination key ("auditor+manager",
+    see role_key) is the OR of its roles, merged on first use.
+    """
+
+    def __init__(self, elements: frozenset, roles: dict, generation=None):
+        self.elements = elements
+        self.roles = roles
+        self.generation = generation
+        self.loaded_at = time.time()
+        self._combinations = {}
+
+    @classmethod
+    def load(cls, generation=None) -> "RuleMatrix":
+        elements = frozenset(BusinessElement.objects.values_list("code", flat=True))
+        rows = AccessRoleRule.objects.values_list(
+            "role__code", "element__code", *RULE_FIELDS
+        )
+        direct = {}
+        for role_code, element_code, *values in rows:
+            flags = Perm(0)
+            for flag, value in zip(RULE_FIELDS.values(), values):
+                if value:
+                    flags |= flag
+            direct.setdefault(role_code, {})[element_code] = flags
+        parents = {}
+        edges = Role.parents.through.objects.values_list("from_role__code", "to_role__code")
+        for child, parent in edges:
+            parents.setdefault(child, set()).add(parent)
+        roles = {
+            code: _merge(direct.get(c, {}) for c in _closure(code, parents))
+            for code in direct.keys() | parents.keys()
+        }
+        return cls(elements, roles, generation)
+
+    def has_element(self, element_code: str) -> bool:
+        return element_code in self.elements
+
+    def get(self, role_code: Optional[str], element_code: Optional[str]) -> Optional[Perm]:
+        """Flags for the pair, or None when no rule row applies to it."""
+        rules = self.roles.get(role_code)
+        if rules is None:
+            if not role_code or ROLE_SEPARATOR not in role_code:
+                return None
+            rules = self._combinations.get(role_code)
+            if rules is None:
+                rules = _merge(self.roles.get(c, {}) for c in role_code.split(ROLE_SEPARATOR))
+                if len(self._combinations) < MAX_COMBINATIONS:
+                    self._combinations[role_code] = rules
+        return rules.get(element_code)
+
+
+def _cache():
+    return caches[getattr(settings, "RBAC_CACHE_ALIAS", "default")]
+
+
+def current_generation():
+    """Rules generation shared by all workers through the cache backend."""
+    try:
+        return _cache().get(GENERATION_KEY)
+    except Exception:
+        log.warning("rules generation is unavailable", exc_info=True)
+        return None
+
+
+def bump_generation() -> None:
+    try:
+        bump_counter(_cache(), GENERATION_KEY)
+    except Exception:
+        log.warning("failed to bump rules generation", exc_info=True)
+
+
+_lock = threading.Lock()
+_matrix: Optional[RuleMatrix] = None
+_checked_at = 0.0
+
+
+def _is_stale(matrix: RuleMatrix) -> bool:
+    global _checked_at
+    interval = getattr(settings, "RBAC_GENERATION_CHECK_MS", 500) / 1000
+    now = time.monotonic()
+    if now - _checked_at < interval:
+        return False
+    _checked_at = now
+    return current_generation() != matrix.generation
+
+
+def get_matrix() -> RuleMatrix:
+    """Process-wide rule matrix.
+
+    Loaded on first use, after invalidate(), and whenever the shared rules
+    generation moved since the snapshot was built (checked at most once per
+    RBAC_GENERATION_CHECK_MS).
+    """
+    global _matrix
+    matrix = _matrix
+    if matrix is not None and not _is_stale(matrix):
+        return matrix
+    with _lock:
+        if _matrix is None or _matrix is matrix:
+            # read the generation first: a bump during load forces another one
+            _matrix = RuleMatrix.load(current_generation())
+        return _matrix
+
+
+def invalidate() -> None:
+    global _matrix
+    with _lock:
+        _matrix = None
+
+
+def get_rule(role_code: Optional[str], element_code: Optional[str]) -> Optional[Perm]:
+    return get_matrix().get(role_code, element_code)
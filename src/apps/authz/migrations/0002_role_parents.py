@@ -0,0 +1,34 @@
+# Generated by Django 5.0.7 on 2026-10-18 19:08
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authz", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="role",
+            name="parents",
+            field=models.ManyToManyField(
+                blank=True, related_name="children", to="authz.role"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="role",
+            name="code",
+            field=models.CharField(
+                max_length=50,
+                unique=True,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        "^[^+]+$", "Role codes can't contain '+'."
+                    )
+                ],
+            ),
+        ),
+    ]
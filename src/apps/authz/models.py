@@ -1,9 +1,21 @@
+from django.core.validators import RegexValidator
 from django.db import models
 
+# joins role codes into the key of a role combination (matrix.role_key)
+ROLE_SEPARATOR = "+"
+
 
 class Role(models.Model):
-    code = models.CharField(max_length=50, unique=True)
+    code = models.CharField(
+        max_length=50,
+        unique=True,
+        validators=[RegexValidator(r"^[^+]+$", "Role codes can't contain '+'.")],
+    )
     name = models.CharField(max_length=100)
+    # rules of the parents (and their parents) apply to this role too
+    parents = models.ManyToManyField(
+        "self", symmetrical=False, related_name="children", blank=True
+    )
 
     def __str__(self) -> str:
         return self.name
@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Iterable, Optional
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 from rest_framework.exceptions import NotAuthenticated, PermissionDenied
 from django.contrib.auth.models import AnonymousUser
-from .models import BusinessElement, AccessRoleRule
+from .matrix import Perm, get_matrix, role_key
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -13,11 +13,68 @@ def resolve_business_element_code(view) -> Optional[str]:
 
 
 def get_user_role(user) -> Optional[str]:
+    """Role key of the user: Profile.role plus Profile.roles, as role_key()."""
+    # token-built users (apps.accounts.stateless.TokenUser) carry the code
+    role_code = getattr(user, "role_code", None)
+    if role_code:
+        return role_code
     try:
-        role = user.profile.role
-        return role.code if role else None
+        profile = user.profile
+        role = profile.role
     except Exception:
         return None
+    return role_key(role.code if role else None, profile.extra_role_codes)
+
+
+def get_request_role(request) -> Optional[str]:
+    """Role code of request.user, resolved once per request.
+
+    JWTAuthMiddleware sets request.role_code from the user it loaded; requests
+    that bypass it fall back to the profile lookup.
+    """
+    role_code = getattr(request, "role_code", None)
+    if role_code is None:
+        role_code = get_user_role(request.user)
+        request.role_code = role_code
+    return role_code
+
+
+def object_allowed(rule: Optional[Perm], method: str, is_owner: bool) -> bool:
+    """Object-level decision of compiled `rule` for one object."""
+    if rule is None:
+        return False
+    method = method.upper()
+    if method in SAFE_METHODS:
+        return Perm.READ_ALL in rule or is_owner
+    if method in ("PUT", "PATCH"):
+        return Perm.UPDATE_ALL in rule or (Perm.UPDATE in rule and is_owner)
+    if method == "DELETE":
+        return Perm.DELETE_ALL in rule or (Perm.DELETE in rule and is_owner)
+    return True
+
+
+def check_objects(
+    user, element_code: str, method: str, objs: Iterable, role_code: Optional[str] = None, queryset=None
+) -> list:
+    """Allow/deny per object of `objs`, with the rule resolved once.
+
+    `objs` are instances (judged by their owner_id, no query), or primary
+    keys when `queryset` is given: their owners then come from one
+    `pk IN (...)` query, and ids missing from `queryset` get None.
+    """
+    if role_code is None:
+        role_code = get_user_role(user)
+    rule = get_matrix().get(role_code, element_code) if role_code else None
+    user_id = getattr(user, "id", None)
+    objs = list(objs)
+    if queryset is None:
+        return [object_allowed(rule, method, getattr(obj, "owner_id", None) == user_id) for obj in objs]
+    owners = dict(
+        queryset.filter(pk__in=[pk for pk in objs if pk is not None]).values_list("pk", "owner_id")
+    )
+    return [
+        object_allowed(rule, method, owners[pk] == user_id) if pk in owners else None for pk in objs
+    ]
 
 
 class RolePermission(BasePermission):
@@ -36,54 +93,49 @@ class RolePermission(BasePermission):
         if not element_code:
             raise PermissionDenied("Business element is not specified")
 
-        role_code = get_user_role(user)
+        role_code = get_request_role(request)
         if not role_code:
             raise PermissionDenied("User has no role")
 
-        try:
-            element = BusinessElement.objects.get(code=element_code)
-        except BusinessElement.DoesNotExist:
+        matrix = get_matrix()
+        if not matrix.has_element(element_code):
             raise PermissionDenied("Unknown business element")
 
-        rule = AccessRoleRule.objects.filter(
-            role__code=role_code, element=element
-        ).first()
-        if not rule:
+        rule = matrix.get(role_code, element_code)
+        if rule is None:
             raise PermissionDenied("No rule for role and element")
 
         method = request.method.upper()
         if method in SAFE_METHODS or method == "GET":
-            return bool(rule.read_permission)
+            return Perm.READ in rule
         if method == "POST":
-            return bool(rule.create_permission)
+            return Perm.CREATE in rule
         if method in ("PUT", "PATCH"):
-            return bool(rule.update_permission)
+            return Perm.UPDATE in rule
         if method == "DELETE":
-            return bool(rule.delete_permission)
+            return Perm.DELETE in rule
 
         return True
 
     def has_object_permission(self, request, view, obj) -> bool:
         user = request.user
         element_code = resolve_business_element_code(view)
-        role_code = get_user_role(user)
+        role_code = get_request_role(request)
 
-        try:
-            element = BusinessElement.objects.get(code=element_code)
-            rule = AccessRoleRule.objects.get(role__code=role_code, element=element)
-        except Exception:
+        rule = get_matrix().get(role_code, element_code)
+        if rule is None:
             raise PermissionDenied("No rule for role and element")
 
-        method = request.method.upper()
-
         owner_id = getattr(obj, "owner_id", None)
-        is_owner = owner_id == getattr(user, "id", None)
-
-        if method in SAFE_METHODS or method == "GET":
-            return bool(rule.read_all_permission or is_owner)
-        if method in ("PUT", "PATCH"):
-            return bool(rule.update_all_permission or (rule.update_permission and is_owner))
-        if method == "DELETE":
-            return bool(rule.delete_all_permission or (rule.delete_permission and is_owner))
-
-        return True
+        return object_allowed(rule, request.method, owner_id == getattr(user, "id", None))
+
+    def has_objects_permission(self, request, view, objs, queryset=None) -> list:
+        """check_objects() for the request's user, role and method."""
+        return check_objects(
+            request.user,
+            resolve_business_element_code(view),
+            request.method,
+            objs,
+            role_code=get_request_role(request),
+            queryset=queryset,
+        )
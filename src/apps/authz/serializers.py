@@ -3,9 +3,28 @@ from .models import Role, BusinessElement, AccessRoleRule
 
 
 class RoleSerializer(serializers.ModelSerializer):
+    parents = serializers.SlugRelatedField(
+        slug_field="code", queryset=Role.objects.all(), many=True, required=False
+    )
+
     class Meta:
         model = Role
-        fields = ["id", "code", "name"]
+        fields = ["id", "code", "name", "parents"]
+
+    def validate_parents(self, parents):
+        if self.instance is None:
+            return parents
+        # walk up from the new parents; meeting this role means a cycle
+        through = Role.parents.through.objects
+        seen, frontier = set(), {role.pk for role in parents}
+        while frontier:
+            if self.instance.pk in frontier:
+                raise serializers.ValidationError("Role inheritance can't be cyclic.")
+            seen |= frontier
+            frontier = set(
+                through.filter(from_role_id__in=frontier).values_list("to_role_id", flat=True)
+            ) - seen
+        return parents
 
 
 class BusinessElementSerializer(serializers.ModelSerializer):
@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from . import matrix
+from .models import AccessRoleRule, BusinessElement, Role
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=BusinessElement)
+@receiver(post_delete, sender=BusinessElement)
+@receiver(post_save, sender=AccessRoleRule)
+@receiver(post_delete, sender=AccessRoleRule)
+@receiver(m2m_changed, sender=Role.parents.through)
+def _invalidate_rule_matrix(sender, **kwargs):
+    # Drop the local snapshot now and again after commit, so a reload that
+    # raced with the still-open transaction cannot keep serving pre-commit
+    # rules. Other workers learn about the change from the shared generation,
+    # which is only bumped once the new rows are visible to them.
+    matrix.invalidate()
+    transaction.on_commit(_publish_rule_change)
+
+
+def _publish_rule_change():
+    matrix.bump_generation()
+    matrix.invalidate()
@@ -0,0 +1,152 @@
+"""Bulk create/update/delete for owned-resource viewsets.
+
+POST|PATCH|DELETE <list>/bulk takes a JSON array. RolePermission runs once
+for the whole batch. Items are validated by a single serializer instance,
+and ownership is checked for all items at once by check_objects, against
+one owner_id lookup for every affected id. The writes go through bulk_create/bulk_update/one DELETE in a
+transaction. The response lists a result per item (in request order); it is
+201/200 when every item succeeded and 207 otherwise.
+"""
+from django.conf import settings
+from django.db import transaction
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from apps.authz.permissions import check_objects, get_request_role
+
+
+class BulkMixin:
+    bulk_batch_size = 1000
+
+    @action(detail=False, methods=["post", "patch", "delete"], url_path="bulk")
+    def bulk(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"detail": "Expected a non-empty JSON array."})
+        limit = int(getattr(settings, "BULK_MAX_ITEMS", 5000))
+        if len(items) > limit:
+            raise ValidationError({"detail": f"At most {limit} items per request."})
+
+        if request.method == "POST":
+            results = self._bulk_create(items)
+            ok_status = status.HTTP_201_CREATED
+        elif request.method == "PATCH":
+            results = self._bulk_update(items)
+            ok_status = status.HTTP_200_OK
+        else:
+            results = self._bulk_delete(items)
+            ok_status = status.HTTP_200_OK
+
+        all_ok = all(r["status"] < 300 for r in results)
+        return Response(
+            {"results": results}, status=ok_status if all_ok else status.HTTP_207_MULTI_STATUS
+        )
+
+    def _validate_items(self, items, partial: bool) -> list:
+        """(attrs | None, errors | None) per item, from one serializer instance."""
+        child = self.get_serializer(partial=partial)
+        out = []
+        for item in items:
+            try:
+                out.append((child.run_validation(item), None))
+            except ValidationError as exc:
+                out.append((None, exc.detail))
+        return out
+
+    @staticmethod
+    def _item_ids(items) -> list:
+        ids = []
+        for item in items:
+            raw = item.get("id") if isinstance(item, dict) else item
+            try:
+                ids.append(int(raw))
+            except (TypeError, ValueError):
+                ids.append(None)
+        return ids
+
+    def _bulk_create(self, items) -> list:
+        model = self.get_queryset().model
+        results, objs = [], []
+        for index, (attrs, errors) in enumerate(self._validate_items(items, partial=False)):
+            if errors is not None:
+                results.append({"index": index, "status": 400, "errors": errors})
+                continue
+            obj = model(**attrs, owner_id=self.request.user.id)
+            results.append({"index": index, "status": 201, "obj": obj})
+            objs.append(obj)
+        with transaction.atomic():
+            model.objects.bulk_create(objs, batch_size=self.bulk_batch_size)
+        for r in results:
+            if "obj" in r:
+                r["id"] = r.pop("obj").pk
+        return results
+
+    def _check(self, method: str, objs, queryset=None) -> list:
+        return check_objects(
+            self.request.user,
+            self.business_element_code,
+            method,
+            objs,
+            role_code=get_request_role(self.request),
+            queryset=queryset,
+        )
+
+    def _bulk_update(self, items) -> list:
+        ids = self._item_ids(items)
+        objs = self.get_queryset().in_bulk([i for i in ids if i is not None])
+        allowed = dict(zip(objs, self._check("PATCH", objs.values())))
+        validated = self._validate_items(
+            [{k: v for k, v in item.items() if k != "id"} if isinstance(item, dict) else item for item in items],
+            partial=True,
+        )
+        model = self.get_queryset().model
+        auto_now = [f for f in model._meta.concrete_fields if getattr(f, "auto_now", False)]
+
+        results, changed, fields = [], {}, set()
+        for index, (pk, (attrs, errors)) in enumerate(zip(ids, validated)):
+            obj = objs.get(pk)
+            if obj is None:
+                results.append({"index": index, "id": pk, "status": 404})
+            elif not allowed[pk]:
+                results.append({"index": index, "id": pk, "status": 403})
+            elif errors is not None:
+                results.append({"index": index, "id": pk, "status": 400, "errors": errors})
+            else:
+                for name, value in attrs.items():
+                    setattr(obj, name, value)
+                fields.update(attrs)
+                changed[pk] = obj
+                results.append({"index": index, "id": pk, "status": 200})
+
+        if changed:
+            for obj in changed.values():
+                for field in auto_now:
+                    field.pre_save(obj, add=False)
+            with transaction.atomic():
+                model.objects.bulk_update(
+                    list(changed.values()),
+                    sorted(fields | {f.name for f in auto_now}),
+                    batch_size=self.bulk_batch_size,
+                )
+        return results
+
+    def _bulk_delete(self, items) -> list:
+        ids = self._item_ids(items)
+        # one owner_id lookup; None marks ids outside the caller's scope
+        checks = self._check("DELETE", ids, queryset=self.get_queryset())
+
+        results, allowed = [], set()
+        for index, (pk, ok) in enumerate(zip(ids, checks)):
+            if ok is None:
+                results.append({"index": index, "id": pk, "status": 404})
+            elif not ok:
+                results.append({"index": index, "id": pk, "status": 403})
+            else:
+                allowed.add(pk)
+                results.append({"index": index, "id": pk, "status": 204})
+        if allowed:
+            with transaction.atomic():
+                self.get_queryset().model.objects.filter(pk__in=allowed).delete()
+        return results
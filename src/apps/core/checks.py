@@ -0,0 +1,26 @@
+"""The generation counters, token versions and revocation counter must live
+in a cache every worker process shares; a per-process LocMemCache keeps each
+worker on its own copy."""
+from django.conf import settings
+from django.core import checks
+
+LOCAL_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache", "django.core.cache.backends.dummy.DummyCache")
+
+
+def process_local_caches() -> list:
+    """Aliases of the caches used for cross-worker state that aren't shared."""
+    aliases = {"default", getattr(settings, "RBAC_CACHE_ALIAS", "default")}
+    return sorted(a for a in aliases if settings.CACHES.get(a, {}).get("BACKEND") in LOCAL_BACKENDS)
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    return [
+        checks.Warning(
+            f"Cache '{alias}' is local to each process.",
+            hint="Several workers need a shared cache (DJANGO_CACHE_BACKEND=RedisCache) to see "
+            "each other's rule changes, token versions and revocations.",
+            id="core.W001",
+        )
+        for alias in process_local_caches()
+    ]
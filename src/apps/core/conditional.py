@@ -0,0 +1,83 @@
+"""Conditional GET (weak ETag / Last-Modified) for owned, timestamped resources.
+
+* detail: ETag and Last-Modified from the fetched object's id and updated_at,
+  computed before anything is serialized;
+* list: ETag only, from the id and updated_at of each row on the page being
+  returned, whether another page follows, and the query string (cursor, page
+  size). No extra query is issued, so a keyset page still costs one LIMIT
+  query however large the caller's scope is.
+
+ETags also hash the caller's scope: the role code and its compiled flags for
+the element, plus the user id when the caller only sees their own rows. A
+role or rule change therefore yields a different ETag and can't be hidden
+behind a 304. Lists carry no Last-Modified and ignore If-Modified-Since: a
+date can't express a deleted row or rows entering the caller's scope after a
+role change, so only If-None-Match revalidates them. A detail's
+Last-Modified is never earlier than the moment this worker loaded its rule
+matrix.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from apps.authz.matrix import Perm, get_matrix
+from apps.authz.permissions import get_request_role
+
+
+class ConditionalGetMixin:
+    conditional_field = "updated_at"
+
+    def _scope_parts(self) -> tuple:
+        matrix = get_matrix()
+        role = get_request_role(self.request)
+        rule = matrix.get(role, self.business_element_code)
+        if rule is not None and Perm.READ_ALL in rule:
+            return (role, int(rule)), matrix.loaded_at
+        return (role, int(rule or 0), self.request.user.id), matrix.loaded_at
+
+    def _validators(self, parts, modified) -> tuple:
+        scope, loaded_at = self._scope_parts()
+        raw = "|".join(map(str, scope + tuple(parts)))
+        etag = 'W/"%s"' % hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+        last_modified = max(modified.timestamp() if modified else 0.0, loaded_at)
+        return etag, int(last_modified)
+
+    def _conditional(self, request, etag, last_modified, build):
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = build()
+        if 200 <= response.status_code < 300 or response.status_code == 304:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ("Authorization",))
+        return response
+
+    def paginate_queryset(self, queryset):
+        self._page = super().paginate_queryset(queryset)
+        return self._page
+
+    def list(self, request, *args, **kwargs):
+        self._page = None
+        response = super().list(request, *args, **kwargs)
+        if self._page is None or response.status_code != 200:
+            return response
+        # the page is already serialized: a 304 saves the transfer, not the query
+        pk, field = self.get_queryset().model._meta.pk.attname, self.conditional_field
+        rows = ",".join(
+            "%s@%s" % (getattr(row, pk), getattr(row, field).isoformat()) for row in self._page
+        )
+        has_next = bool(getattr(self.paginator, "has_next", False))
+        etag, _ = self._validators((rows, has_next, request.META.get("QUERY_STRING", "")), None)
+        return self._conditional(request, etag, None, lambda: response)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        modified = getattr(instance, self.conditional_field)
+        etag, last_modified = self._validators((instance.pk, modified.isoformat()), modified)
+        return self._conditional(
+            request, etag, last_modified, lambda: Response(self.get_serializer(instance).data)
+        )
@@ -0,0 +1,20 @@
+"""Change counters shared between worker processes through the Django cache.
+
+Workers remember the last value they saw and resync when it moves. A counter
+that goes missing (first write, eviction, cache restart) is seeded from the
+clock rather than restarted at 1, so a worker holding a pre-eviction number
+never sees that number again.
+"""
+import time
+
+
+def bump_counter(cache, key: str) -> None:
+    """Increment `key` in `cache`, seeding it from time.time_ns() if missing.
+
+    Cache errors propagate; callers decide how loudly to report them.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, time.time_ns(), timeout=None):
+            cache.incr(key)
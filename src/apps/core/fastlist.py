@@ -0,0 +1,102 @@
+"""Read-only fast path for list actions.
+
+A ModelSerializer(many=True) builds a model instance per row and runs every
+field's get_attribute/to_representation, which dominates CPU on large pages.
+For serializers made of plain model columns, FastListSerializer reads
+.values_list(named=True) rows and formats them with precomputed per-column
+formatters, producing the same dicts (and so byte-identical JSON).
+Serializers with anything else (method fields, nested or dotted sources,
+custom datetime formats) fall back to the regular list.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .export import format_datetime
+
+# DRF field types whose to_representation is the identity for DB values
+_PLAIN = (serializers.IntegerField, serializers.CharField, serializers.BooleanField)
+
+
+class FastListSerializer:
+    def __init__(self, model, names: tuple, attnames: tuple, datetimes: tuple):
+        self.model = model
+        self.names = names
+        self.attnames = attnames
+        self.datetimes = datetimes  # bool per column
+        pk = model._meta.pk.attname
+        # keyset pagination reads the ordering column off each row
+        self.columns = attnames if pk in attnames else attnames + (pk,)
+
+    @classmethod
+    def build(cls, serializer_class):
+        """FastListSerializer for serializer_class, or None if it isn't plain columns."""
+        model = serializer_class.Meta.model
+        names, attnames, datetimes = [], [], []
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if type(field) is serializers.DateTimeField:
+                fmt = getattr(field, "format", api_settings.DATETIME_FORMAT)
+                if fmt is None or fmt.lower() != ISO_8601 or hasattr(field, "timezone"):
+                    return None
+            elif not isinstance(field, _PLAIN) or isinstance(field, serializers.ModelField):
+                return None
+            if "." in field.source or field.source == "*":
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if model_field.is_relation and model_field.attname != field.source:
+                return None
+            names.append(name)
+            attnames.append(model_field.attname)
+            datetimes.append(type(field) is serializers.DateTimeField)
+        return cls(model, tuple(names), tuple(attnames), tuple(datetimes))
+
+    def rows(self, queryset, *extra):
+        """Named rows of the serialized columns, plus any extra attnames after them."""
+        columns = self.columns + tuple(c for c in extra if c not in self.columns)
+        return queryset.values_list(*columns, named=True)
+
+    def to_representation(self, rows) -> list:
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        names, width = self.names, len(self.names)
+        dt_index = [i for i, is_dt in enumerate(self.datetimes) if is_dt]
+        out = []
+        for row in rows:
+            values = list(row[:width])
+            for i in dt_index:
+                value = values[i]
+                values[i] = format_datetime(value, tz) if value else None
+            out.append(dict(zip(names, values)))
+        return out
+
+
+@lru_cache(maxsize=None)
+def get_fast_serializer(serializer_class):
+    return FastListSerializer.build(serializer_class)
+
+
+class FastListMixin:
+    """Serves list() through FastListSerializer when the serializer allows it."""
+
+    fast_list = True
+
+    def list(self, request, *args, **kwargs):
+        fast = get_fast_serializer(self.get_serializer_class()) if self.fast_list else None
+        if fast is None:
+            return super().list(request, *args, **kwargs)
+        # ConditionalGetMixin reads the validator column off each row of the page
+        extra = (self.conditional_field,) if hasattr(self, "conditional_field") else ()
+        rows = fast.rows(self.filter_queryset(self.get_queryset()), *extra)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(fast.to_representation(page))
+        return Response(fast.to_representation(rows))
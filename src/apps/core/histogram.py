@@ -0,0 +1,26 @@
+"""Latency histogram shared by the request statistics and the password-hash pool."""
+import bisect
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (upper bounds in ms)."""
+
+    BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.total_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.total_ms += ms
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{b}ms" for b in self.BOUNDS_MS] + ["inf"]
+        count = sum(self.counts)
+        return {
+            "count": count,
+            "avg_ms": self.total_ms / count if count else 0.0,
+            "buckets": dict(zip(labels, self.counts)),
+        }
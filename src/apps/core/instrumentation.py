@@ -0,0 +1,283 @@
+"""Per-route query count and latency statistics (REQUEST_STATS_SAMPLE_RATE).
+
+RequestStatsMiddleware sits first in MIDDLEWARE so it sees everything the
+other middleware and the view do. For a sampled request it counts queries
+and their time through connection.execute_wrapper, and times the request
+as a whole plus the response rendering (the renderer's serialization). The
+numbers are aggregated in memory per "METHOD view_name". Every
+REQUEST_STATS_FLUSH_SEC a worker writes its totals to the Django cache, where
+the staff endpoint and `manage.py request_stats` merge all workers.
+
+Apps publish other in-process counters (token cache, hash pool) with
+register_component(); they ride along with each flush and are reported per
+worker as they are.
+
+Unsampled requests cost one random() call and a clock read. With a rate of 0
+the middleware removes itself at startup.
+"""
+import os
+import random
+import socket
+import threading
+import time
+from collections import defaultdict
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from .histogram import LatencyHistogram
+
+INDEX_KEY = "core:reqstats:workers"
+WORKER_KEY = "core:reqstats:{}"
+RESET_KEY = "core:reqstats:reset"
+WORKER_TTL = 24 * 3600
+
+
+class RouteStats:
+    __slots__ = ("count", "queries", "queries_max", "db_ms", "total_ms", "render_ms", "latency")
+
+    def __init__(self):
+        self.count = self.queries = self.queries_max = 0
+        self.db_ms = self.total_ms = self.render_ms = 0.0
+        self.latency = LatencyHistogram()
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "queries": self.queries,
+            "queries_max": self.queries_max,
+            "db_ms": self.db_ms,
+            "total_ms": self.total_ms,
+            "render_ms": self.render_ms,
+            "buckets": list(self.latency.counts),
+        }
+
+
+class RequestStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = defaultdict(RouteStats)
+        self._flushed_at = time.monotonic()
+        self._reset_seen = None
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+
+    def record(self, key: str, queries: int, db_s: float, total_s: float, render_s: float) -> None:
+        with self._lock:
+            stats = self._routes[key]
+            stats.count += 1
+            stats.queries += queries
+            stats.queries_max = max(stats.queries_max, queries)
+            stats.db_ms += db_s * 1000
+            stats.total_ms += total_s * 1000
+            stats.render_ms += render_s * 1000
+            stats.latency.observe(total_s)
+        self.maybe_flush()
+
+    def maybe_flush(self) -> None:
+        interval = float(getattr(settings, "REQUEST_STATS_FLUSH_SEC", 10))
+        if time.monotonic() - self._flushed_at >= interval:
+            self.flush()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {key: stats.snapshot() for key, stats in self._routes.items()}
+
+    def flush(self) -> None:
+        """Publish this worker's totals to the cache."""
+        self._flushed_at = time.monotonic()
+        try:
+            reset_at = cache.get(RESET_KEY)
+            if reset_at is not None and reset_at != self._reset_seen:
+                self._reset_seen = reset_at
+                self.reset()
+            published = {"routes": self.snapshot(), "components": component_stats()}
+            cache.set(WORKER_KEY.format(self.worker), published, WORKER_TTL)
+            workers = cache.get(INDEX_KEY) or []
+            if self.worker not in workers:
+                cache.set(INDEX_KEY, workers + [self.worker], WORKER_TTL)
+        except Exception:
+            pass  # statistics must never fail a request
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+_stats = RequestStats()
+_components = {}
+
+
+def register_component(name: str, stats) -> None:
+    """Publish stats() (a JSON-serializable dict, or None) with this worker's totals."""
+    _components[name] = stats
+
+
+def component_stats() -> dict:
+    out = {}
+    for name, stats in _components.items():
+        try:
+            value = stats()
+        except Exception:
+            continue
+        if value is not None:
+            out[name] = value
+    return out
+
+
+def get_stats() -> RequestStats:
+    return _stats
+
+
+def reset_all() -> None:
+    """Drop the published totals; every worker clears its own on next flush."""
+    workers = cache.get(INDEX_KEY) or []
+    cache.delete_many([WORKER_KEY.format(w) for w in workers] + [INDEX_KEY])
+    cache.set(RESET_KEY, time.time(), None)
+
+
+def _published() -> dict:
+    """worker -> what it last flushed, this process included."""
+    get_stats().flush()
+    workers = cache.get(INDEX_KEY) or []
+    keys = {WORKER_KEY.format(w): w for w in workers}
+    return {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+
+
+def worker_components() -> dict:
+    """worker -> its register_component() stats, as last published."""
+    return {
+        worker: published["components"]
+        for worker, published in sorted(_published().items())
+        if published["components"]
+    }
+
+
+def merged_snapshot() -> dict:
+    """Totals of all workers that flushed to the cache, plus this process."""
+    merged = {}
+    for published in _published().values():
+        for key, row in published["routes"].items():
+            into = merged.get(key)
+            if into is None:
+                merged[key] = {**row, "buckets": list(row["buckets"])}
+                continue
+            for field in ("count", "queries", "db_ms", "total_ms", "render_ms"):
+                into[field] += row[field]
+            into["queries_max"] = max(into["queries_max"], row["queries_max"])
+            into["buckets"] = [a + b for a, b in zip(into["buckets"], row["buckets"])]
+    return merged
+
+
+def _quantile(buckets: list, q: float) -> float | None:
+    """Upper bound (ms) of the histogram bucket holding quantile q."""
+    total = sum(buckets)
+    if not total:
+        return None
+    seen = 0
+    for bound, n in zip(LatencyHistogram.BOUNDS_MS + (float("inf"),), buckets):
+        seen += n
+        if seen >= q * total:
+            return bound
+    return float("inf")
+
+
+def report(snapshot: dict, sort: str = "total_ms", top: int = 20) -> list:
+    """Rows (dicts) for the `top` routes by summed `sort` column."""
+    rows = []
+    for key, row in snapshot.items():
+        n = row["count"] or 1
+        rows.append({
+            "route": key,
+            "count": row["count"],
+            "queries_avg": row["queries"] / n,
+            "queries_max": row["queries_max"],
+            "db_ms_avg": row["db_ms"] / n,
+            "render_ms_avg": row["render_ms"] / n,
+            "total_ms_avg": row["total_ms"] / n,
+            "p50_ms_le": _quantile(row["buckets"], 0.5),
+            "p99_ms_le": _quantile(row["buckets"], 0.99),
+            "_sort": row.get(sort, 0),
+        })
+    rows.sort(key=lambda r: r.pop("_sort"), reverse=True)
+    return rows[:top]
+
+
+class _QueryCounter:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class RequestStatsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.rate = float(getattr(settings, "REQUEST_STATS_SAMPLE_RATE", 0))
+        if self.rate <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if random.random() >= self.rate:
+            response = self.get_response(request)
+            get_stats().maybe_flush()  # keep component stats fresh between samples
+            return response
+        counter = _QueryCounter()
+        request._stats_render = [0.0]
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        self._record(request, counter, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        # async views run their queries on executor threads, whose
+        # connections this wrapper can't see: timings only
+        if random.random() >= self.rate:
+            response = await self.get_response(request)
+            get_stats().maybe_flush()
+            return response
+        request._stats_render = [0.0]
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, _QueryCounter(), time.perf_counter() - start)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after the view; time the renderer
+        if hasattr(request, "_stats_render"):
+            started = time.perf_counter()
+
+            def rendered(r):
+                request._stats_render[0] += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def _record(self, request, counter, total) -> None:
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            route = "<unresolved>"
+        else:
+            route = match.view_name or match.route
+        get_stats().record(
+            f"{request.method} {route}", counter.count, counter.seconds, total, request._stats_render[0]
+        )
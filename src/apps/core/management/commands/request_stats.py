@@ -0,0 +1,43 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from apps.core.instrumentation import merged_snapshot, report, reset_all, worker_components
+from apps.core.views import SORT_COLUMNS
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+class Command(BaseCommand):
+    help = "Top routes by query count / latency, as recorded by RequestStatsMiddleware"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=20)
+        parser.add_argument("--sort", choices=sorted(SORT_COLUMNS), default="total_ms")
+        parser.add_argument("--reset", action="store_true", help="Clear the statistics afterwards")
+
+    def handle(self, *args, **kwargs):
+        rows = report(merged_snapshot(), kwargs["sort"], kwargs["top"])
+        if not rows:
+            self.stdout.write("No requests recorded (is REQUEST_STATS_SAMPLE_RATE > 0?).")
+        else:
+            width = max(len(row["route"]) for row in rows)
+            self.stdout.write(
+                f"{'route':<{width}} {'count':>8} {'q/req':>6} {'q max':>6} {'db ms':>8}"
+                f" {'render':>8} {'total':>8} {'p50<=':>8} {'p99<=':>8}"
+            )
+            for row in rows:
+                self.stdout.write(
+                    f"{row['route']:<{width}} {row['count']:>8} {row['queries_avg']:>6.1f}"
+                    f" {row['queries_max']:>6} {row['db_ms_avg']:>8.2f} {row['render_ms_avg']:>8.2f}"
+                    f" {row['total_ms_avg']:>8.2f} {_ms(row['p50_ms_le']):>8} {_ms(row['p99_ms_le']):>8}"
+                )
+        for worker, components in worker_components().items():
+            self.stdout.write(f"\n{worker}")
+            for name, stats in sorted(components.items()):
+                self.stdout.write(f"  {name}: {json.dumps(stats, sort_keys=True)}")
+        if kwargs["reset"]:
+            reset_all()
+            self.stdout.write(self.style.SUCCESS("Statistics reset."))
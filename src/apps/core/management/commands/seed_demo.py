@@ -1,22 +1,100 @@
-from django.core.management.base import BaseCommand
+import itertools
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
 from apps.authz.models import Role, BusinessElement, AccessRoleRule
 from apps.accounts.models import Credential, Profile
-from apps.accounts.utils import hash_password
+from apps.accounts.utils import HASHERS, hash_password
 from apps.mock.models import Good, Order
 
 User = get_user_model()
 
+
+class _Progress:
+    def __init__(self, stdout, label: str, total: int):
+        self.stdout, self.label, self.total = stdout, label, total
+        self.done = 0
+        self.started = time.monotonic()
+
+    def step(self, n: int) -> None:
+        self.done += n
+        elapsed = time.monotonic() - self.started
+        rate = self.done / elapsed if elapsed else 0
+        self.stdout.write(
+            f"  {self.label}: {self.done:,}/{self.total:,} ({elapsed:.1f}s, {rate:,.0f} rows/s)"
+        )
+
+
+def _owner_picker(rng: random.Random, owner_ids: list, skew: float):
+    """Draws owner ids; with skew s > 0 the k-th most active owner has weight 1/k**s."""
+    ranked = owner_ids[:]
+    rng.shuffle(ranked)  # activity must not follow creation order
+    if skew <= 0:
+        return lambda k: rng.choices(ranked, k=k)
+    cum_weights = list(itertools.accumulate(1 / rank**skew for rank in range(1, len(ranked) + 1)))
+    return lambda k: rng.choices(ranked, cum_weights=cum_weights, k=k)
+
+
+def _insert(model, fields: list, rows: list) -> None:
+    """Insert plain row tuples: COPY on PostgreSQL, executemany elsewhere."""
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    columns = ", ".join(qn(model._meta.get_field(f).column) for f in fields)
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            with cursor.cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:
+            placeholders = ", ".join(["%s"] * len(fields))
+            cursor.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows)
+
+
 class Command(BaseCommand):
-    help = "Seed demo users, roles on profiles, and a couple of goods/orders"
+    help = (
+        "Seed demo users, roles on profiles, and a couple of goods/orders; "
+        "--users N adds a synthetic data set of any size"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hasher",
+            choices=sorted(HASHERS),
+            default=None,
+            help="Credential hasher for demo passwords (default: first of CREDENTIAL_HASHERS). "
+            "'fast' is for local/test data only and must be enabled in CREDENTIAL_HASHERS.",
+        )
+        parser.add_argument("--users", type=int, default=0, help="Synthetic users to add")
+        parser.add_argument("--goods-per-user", type=float, default=0, help="Mean goods per synthetic user")
+        parser.add_argument("--orders-per-user", type=float, default=0, help="Mean orders per synthetic user")
+        parser.add_argument(
+            "--roles",
+            nargs="+",
+            default=["user"],
+            help="Role codes assigned round-robin to synthetic users (repeat a code to weight it)",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=0.0,
+            help="Zipf exponent of rows per owner (0 = uniform, ~1 = a few owners hold most rows)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed; also names the users")
+        parser.add_argument("--batch-size", type=int, default=10_000)
 
     def handle(self, *args, **kwargs):
+        hasher = kwargs.get("hasher")
+
         def ensure_user(email, pwd, first, role_code):
             u, created = User.objects.get_or_create(
                 username=email, defaults={"email": email, "first_name": first, "is_active": True}
             )
             if created:
-                Credential.objects.create(user=u, password_hash=hash_password(pwd))
+                Credential.objects.create(user=u, password_hash=hash_password(pwd, hasher=hasher))
                 self.stdout.write(self.style.SUCCESS(f"Created user {email}"))
             prof, _ = Profile.objects.get_or_create(user=u)
             try:
@@ -37,3 +115,64 @@ class Command(BaseCommand):
         Order.objects.get_or_create(number="B-200", owner=mgr)
 
         self.stdout.write(self.style.SUCCESS("Demo data seeded."))
+
+        if kwargs["users"] > 0:
+            self._generate(**kwargs)
+
+    def _generate(self, *, users, goods_per_user, orders_per_user, roles, skew, seed, batch_size, hasher, **_):
+        rng = random.Random(seed)
+        role_ids = dict(Role.objects.filter(code__in=roles).values_list("code", "id"))
+        missing = sorted(set(roles) - set(role_ids))
+        if missing:
+            raise CommandError(f"Unknown role(s): {', '.join(missing)}")
+        domain = f"seed{seed}.test"
+        if User.objects.filter(username__endswith=f"@{domain}").exists():
+            raise CommandError(f"Users @{domain} already exist; pick another --seed")
+
+        # one hash shared by every synthetic user (password "secret123")
+        password_hash = hash_password("secret123", hasher=hasher)
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        # raw inserts: no model instances and no post_save signals (the
+        # profiles are written here), which bulk_create alone can't avoid
+        owner_ids = []
+        progress = _Progress(self.stdout, "users", users)
+        for lo in range(0, users, batch_size):
+            hi = min(lo + batch_size, users)
+            last_id = owner_ids[-1] if owner_ids else 0
+            with transaction.atomic():
+                _insert(
+                    User,
+                    ["password", "is_superuser", "username", "first_name", "last_name",
+                     "email", "is_staff", "is_active", "date_joined"],
+                    [("!", False, f"load{i}@{domain}", "", "", f"load{i}@{domain}", False, True, now)
+                     for i in range(lo, hi)],
+                )
+                ids = list(
+                    User.objects.filter(id__gt=last_id, username__endswith=f"@{domain}")
+                    .order_by("id")
+                    .values_list("id", flat=True)
+                )
+                _insert(Credential, ["user_id", "password_hash"], [(uid, password_hash) for uid in ids])
+                _insert(
+                    Profile,
+                    ["user_id", "patronymic", "role_id", "extra_role_codes", "token_version"],
+                    [(uid, "", role_ids[roles[(lo + n) % len(roles)]], "", 0) for n, uid in enumerate(ids)],
+                )
+            owner_ids.extend(ids)
+            progress.step(len(ids))
+
+        pick = _owner_picker(rng, owner_ids, skew)
+        for model, per_user, column, fmt in (
+            (Good, goods_per_user, "title", "good {}"),
+            (Order, orders_per_user, "number", f"S{seed}-{{}}"),
+        ):
+            total = round(users * per_user)
+            progress = _Progress(self.stdout, model._meta.verbose_name_plural, total)
+            for lo in range(0, total, batch_size):
+                owners = pick(min(batch_size, total - lo))
+                rows = [(fmt.format(lo + n), owner, now, now) for n, owner in enumerate(owners)]
+                with transaction.atomic():
+                    _insert(model, [column, "owner_id", "created_at", "updated_at"], rows)
+                progress.step(len(rows))
+
+        self.stdout.write(self.style.SUCCESS(f"Synthetic data seeded (seed={seed})."))
@@ -10,6 +10,14 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class OwnedQuerySet(models.QuerySet):
+    def visible_to(self, user, element_code: str, role_code=None):
+        """Rows `user` may read of business element `element_code` (apps.core.scoping)."""
+        from .scoping import visibility_q
+
+        return self.filter(visibility_q(user, element_code, role_code))
+
+
 class OwnedModel(models.Model):
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -17,7 +25,30 @@ class OwnedModel(models.Model):
         null=True,
         blank=True,
         related_name="%(app_label)s_%(class)s_owned",
+        db_index=False,  # covered by the (owner, -id) index below
     )
 
+    objects = OwnedQuerySet.as_manager()
+
     class Meta:
         abstract = True
+        # owner-scoped lists: WHERE owner_id = ? ORDER BY id DESC
+        indexes = [
+            models.Index(fields=["owner", "-id"], name="%(app_label)s_%(class)s_own_id_idx"),
+        ]
+
+
+class OwnedTimeStampedModel(TimeStampedModel, OwnedModel):
+    """Owned + timestamped; also indexes the owner's rows by creation time.
+
+    Meta is declared explicitly because with several abstract bases a model
+    only inherits the first base's Meta (and would lose OwnedModel's indexes).
+    """
+
+    class Meta(OwnedModel.Meta):
+        abstract = True
+        indexes = OwnedModel.Meta.indexes + [
+            models.Index(
+                fields=["owner", "-created_at"], name="%(app_label)s_%(class)s_own_ca_idx"
+            ),
+        ]
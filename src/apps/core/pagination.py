@@ -0,0 +1,20 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """Opaque-cursor pagination on the primary key, newest first.
+
+    Pages are fetched with WHERE id < <cursor> ORDER BY id DESC LIMIT n+1, so
+    page N costs the same as page 1 and no COUNT(*) is issued. The page size
+    defaults to KEYSET_PAGE_SIZE and can be chosen by the client with
+    ?page_size=, capped at KEYSET_MAX_PAGE_SIZE.
+    """
+
+    ordering = "-id"
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        self.page_size = int(getattr(settings, "KEYSET_PAGE_SIZE", 100))
+        self.max_page_size = int(getattr(settings, "KEYSET_MAX_PAGE_SIZE", 1000))
+        return super().get_page_size(request)
@@ -0,0 +1,47 @@
+"""RBAC row scoping for owned models, applied in SQL.
+
+visibility_q(user, element_code) is the read scope of the user's role for a
+business element, taken from the in-process rule matrix (no query):
+everything with READ_ALL, the user's own rows with READ, nothing otherwise.
+OwnedQuerySet.visible_to applies it, so counts, aggregates and further
+filters stay one query. OwnedScopeMixin uses it for safe methods only; writes
+keep the owner filter for roles without READ_ALL and leave the decision to
+the object-level checks, so a write-only rule still reaches its own rows. `prefix` scopes through a relation instead, e.g.
+`visibility_q(user, "goods", prefix="good__")` on a model with a `good` FK.
+"""
+from typing import Optional
+
+from django.db.models import Q
+from rest_framework.permissions import SAFE_METHODS
+
+from apps.authz.matrix import Perm, get_rule
+from apps.authz.permissions import get_request_role, get_user_role
+
+
+def visibility_q(user, element_code: str, role_code: Optional[str] = None, prefix: str = "") -> Q:
+    if role_code is None:
+        role_code = get_user_role(user)
+    rule = get_rule(role_code, element_code) if role_code else None
+    if rule is None or not rule & (Perm.READ | Perm.READ_ALL):
+        return Q(**{f"{prefix}pk__in": []})  # empty without a query
+    if Perm.READ_ALL in rule:
+        return Q()
+    return Q(**{f"{prefix}owner_id": user.id})
+
+
+class OwnedScopeMixin:
+    """get_queryset() limited to the caller's rows of business_element_code.
+
+    Reads see the role's read scope; writes see everything with READ_ALL and
+    the caller's own rows otherwise (RolePermission judges each object).
+    """
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        user, role_code = self.request.user, get_request_role(self.request)
+        if self.request.method in SAFE_METHODS:
+            return qs.visible_to(user, self.business_element_code, role_code)
+        rule = get_rule(role_code, self.business_element_code) if role_code else None
+        if rule is None or Perm.READ_ALL not in rule:
+            return qs.filter(owner_id=user.id)
+        return qs
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import RequestStatsView
+
+urlpatterns = [
+    path("request-stats", RequestStatsView.as_view()),
+]
@@ -0,0 +1,36 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .instrumentation import merged_snapshot, report, reset_all, worker_components
+
+SORT_COLUMNS = {"count", "queries", "queries_max", "db_ms", "total_ms", "render_ms"}
+
+
+class RequestStatsView(APIView):
+    """Per-route request statistics of all workers (staff only).
+
+    GET ?sort=<column>&top=<n>, plus each worker's component counters (token
+    cache, hash pool); DELETE resets the per-route counters of all workers.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        sort = request.query_params.get("sort", "total_ms")
+        if sort not in SORT_COLUMNS:
+            return Response({"detail": f"sort must be one of {sorted(SORT_COLUMNS)}"}, status=400)
+        try:
+            top = int(request.query_params.get("top", 20))
+        except ValueError:
+            return Response({"detail": "top must be an integer"}, status=400)
+        return Response(
+            {
+                "sort": sort,
+                "routes": report(merged_snapshot(), sort, top),
+                "workers": worker_components(),
+            }
+        )
+
+    def delete(self, request):
+        reset_all()
+        return Response(status=204)
@@ -1,13 +1,13 @@
 from django.db import models
-from apps.core.models import TimeStampedModel, OwnedModel
+from apps.core.models import OwnedTimeStampedModel
 
-class Good(TimeStampedModel, OwnedModel):
+class Good(OwnedTimeStampedModel):
     title = models.CharField(max_length=200)
 
     def __str__(self) -> str:
         return f"{self.id}:{self.title}"
 
-class Order(TimeStampedModel, OwnedModel):
+class Order(OwnedTimeStampedModel):
     number = models.CharField(max_length=50)
 
     def __str__(self) -> str:
@@ -1,50 +1,50 @@
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import QuerySet
 
-from apps.authz.models import AccessRoleRule, BusinessElement
 from apps.authz.permissions import RolePermission
+from apps.core.bulk import BulkMixin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.export import ExportMixin
+from apps.core.fastlist import FastListMixin
+from apps.core.pagination import KeysetPagination
+from apps.core.scoping import OwnedScopeMixin
 from .models import Good, Order
 from .serializers import GoodSerializer, OrderSerializer
 
-def _get_rule(user, element_code: str) -> AccessRoleRule | None:
-    role = getattr(getattr(user, "profile", None), "role", None)
-    if not role:
-        return None
-    try:
-        element = BusinessElement.objects.get(code=element_code)
-    except BusinessElement.DoesNotExist:
-        return None
-    return AccessRoleRule.objects.filter(role=role, element=element).first()
-
-class GoodViewSet(ModelViewSet):
+class GoodViewSet(
+    OwnedScopeMixin, ConditionalGetMixin, FastListMixin, BulkMixin, ExportMixin, ModelViewSet
+):
     queryset = Good.objects.all().order_by("-id")
     serializer_class = GoodSerializer
     permission_classes = [IsAuthenticated, RolePermission]
+    pagination_class = KeysetPagination
     business_element_code = "goods"
-
-    def get_queryset(self) -> QuerySet:
-        qs = super().get_queryset()
-        rule = _get_rule(self.request.user, self.business_element_code)
-        if not rule or not rule.read_all_permission:
-            return qs.filter(owner_id=self.request.user.id)
-        return qs
+    export_fields = (
+        ("id", "id"),
+        ("title", "title"),
+        ("owner", "owner_id"),
+        ("created_at", "created_at"),
+        ("updated_at", "updated_at"),
+    )
 
     def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+        serializer.save(owner_id=self.request.user.id)
 
-class OrderViewSet(ModelViewSet):
+class OrderViewSet(
+    OwnedScopeMixin, ConditionalGetMixin, FastListMixin, BulkMixin, ExportMixin, ModelViewSet
+):
     queryset = Order.objects.all().order_by("-id")
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated, RolePermission]
+    pagination_class = KeysetPagination
     business_element_code = "orders"
-
-    def get_queryset(self) -> QuerySet:
-        qs = super().get_queryset()
-        rule = _get_rule(self.request.user, self.business_element_code)
-        if not rule or not rule.read_all_permission:
-            return qs.filter(owner_id=self.request.user.id)
-        return qs
+    export_fields = (
+        ("id", "id"),
+        ("number", "number"),
+        ("owner", "owner_id"),
+        ("created_at", "created_at"),
+        ("updated_at", "updated_at"),
+    )
 
     def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+        serializer.save(owner_id=self.request.user.id)
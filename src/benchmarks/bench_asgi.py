@@ -0,0 +1,78 @@
+"""Auth-path throughput under ASGI: DRF (sync) views vs. the /aio/ async views.
+
+Requests go through Django's ASGI handler in-process (AsyncClient), with
+--concurrency of them in flight at once. The sync views are handed to
+asgiref's thread executor; the async ones stay on the event loop except for
+the ORM calls themselves.
+
+    cd src && python -m benchmarks.bench_asgi [-n 2000] [--concurrency 50] [--stateless]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+
+async def _load(client, path, headers, n, concurrency):
+    gate = asyncio.Semaphore(concurrency)
+    samples = []
+
+    async def one():
+        async with gate:
+            t0 = time.perf_counter()
+            r = await client.get(path, headers=headers)
+            samples.append(time.perf_counter() - t0)
+            assert r.status_code == 200, r.content
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n)))
+    total = time.perf_counter() - start
+    samples.sort()
+    return n / total, statistics.median(samples) * 1e6, samples[int(n * 0.99) - 1] * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--stateless", action="store_true")
+    args = parser.parse_args(argv)
+
+    # the executor thread and the loop need to see the same database
+    os.environ.setdefault("SQLITE_PATH", os.path.join(tempfile.mkdtemp(), "bench.sqlite3"))
+    from .common import setup_django
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import AsyncClient
+
+    from apps.accounts.models import Profile
+    from apps.accounts.stateless import access_claims
+    from apps.accounts.utils import make_access
+    from apps.authz.models import Role
+
+    settings.JWT_STATELESS_ACCESS = args.stateless
+    user = get_user_model().objects.create(username="bench@local", email="bench@local")
+    Profile.objects.filter(user=user).update(role=Role.objects.get(code="user"))
+    user = get_user_model().objects.select_related("profile__role").get(pk=user.pk)
+    headers = {"Authorization": f"Bearer {make_access(user.id, access_claims(user))}"}
+    client = AsyncClient()
+
+    async def run():
+        for sync_path, async_path in (
+            ("/api/auth/whoami", "/api/auth/aio/whoami"),
+            ("/api/auth/users/me", "/api/auth/aio/users/me"),
+        ):
+            for path in (sync_path, async_path):
+                await _load(client, path, headers, min(args.n, 200), args.concurrency)  # warm-up
+                rps, p50, p99 = await _load(client, path, headers, args.n, args.concurrency)
+                print(f"{path:<40} {rps:>10,.0f} req/s   p50 {p50:>9.1f} µs   p99 {p99:>9.1f} µs")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Orders created/sec: one POST per order vs. POST /api/mock/orders/bulk/.
+
+    cd src && python -m benchmarks.bench_bulk [-n 2000] [--batch 2000]
+"""
+import argparse
+import itertools
+import time
+
+from .common import setup_django
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2000, help="orders per mode")
+    parser.add_argument("--batch", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+
+    from apps.accounts.models import Profile
+    from apps.accounts.utils import make_access
+    from apps.authz.models import Role
+
+    user = get_user_model().objects.create(username="bench@local", email="bench@local")
+    Profile.objects.filter(user=user).update(role=Role.objects.get(code="user"))
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {make_access(user.id)}")
+    seq = itertools.count()
+
+    start = time.perf_counter()
+    for _ in range(args.n):
+        r = client.post(
+            "/api/mock/orders/", {"number": f"S-{next(seq)}"}, content_type="application/json"
+        )
+        assert r.status_code == 201, r.content
+    single = args.n / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for offset in range(0, args.n, args.batch):
+        items = [{"number": f"B-{next(seq)}"} for _ in range(min(args.batch, args.n - offset))]
+        r = client.post("/api/mock/orders/bulk/", items, content_type="application/json")
+        assert r.status_code == 201, r.content
+    bulk = args.n / (time.perf_counter() - start)
+
+    print(f"{'single POST':<40} {single:>12,.0f} orders/s")
+    print(f"{f'bulk POST (batch={args.batch})':<40} {bulk:>12,.0f} orders/s   x{bulk / single:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""JWT sign/verify cost per algorithm, through the key ring.
+
+The "PEM per call" line is what decode_token paid when handing PyJWT a PEM
+string on every request.
+
+    cd src && python -m benchmarks.bench_jwt [-n 2000]
+"""
+import argparse
+
+from .common import measure, report, setup_django
+
+
+def _keys():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    def pem(private):
+        return private.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+
+    return {
+        "RS256": pem(rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+        "ES256": pem(ec.generate_private_key(ec.SECP256R1())),
+        "EdDSA": pem(ed25519.Ed25519PrivateKey.generate()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    setup_django(migrate=False)
+    import jwt
+    from django.conf import settings
+
+    from apps.accounts.keys import KeyRing, _build_key
+    from apps.accounts.utils import make_access
+
+    specs = [{"kid": "HS256", "alg": "HS256", "secret": settings.JWT_SECRET}]
+    try:
+        specs += [{"kid": alg, "alg": alg, "private_key": pem} for alg, pem in _keys().items()]
+    except ImportError:
+        print("cryptography is not installed; only HS256 is measured")
+
+    payload = jwt.decode(make_access(1), options={"verify_signature": False})
+    for spec in specs:
+        ring = KeyRing([_build_key(spec)], spec["kid"])
+        token = ring.encode(payload)
+        report(f"{spec['alg']} sign", measure(lambda: ring.encode(payload), args.n, 20))
+        report(f"{spec['alg']} verify", measure(lambda: ring.decode(token), args.n, 20))
+        if "private_key" in spec:
+            public = ring.signing.verifying
+            from cryptography.hazmat.primitives import serialization
+
+            public_pem = public.public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            report(
+                f"{spec['alg']} verify, PEM per call",
+                measure(lambda: jwt.decode(token, public_pem, algorithms=[spec["alg"]]), args.n, 20),
+            )
+        print(f"  token length {len(token)} bytes")
+
+
+if __name__ == "__main__":
+    main()
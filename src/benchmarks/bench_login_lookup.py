@@ -0,0 +1,74 @@
+"""Login lookup cost as the user table grows (LOWER(email) index vs email__iexact).
+
+    cd src && python -m benchmarks.bench_login_lookup [--users 1000000] [-n 2000]
+
+Prints one line per checkpoint (10k, 100k, ... up to --users); the indexed
+lookup should stay flat while the iexact scan grows with the table.
+"""
+import argparse
+
+from .common import measure, report, setup_django
+
+
+def _seed(start: int, stop: int) -> None:
+    from django.contrib.auth import get_user_model
+    from django.db import connection, transaction
+
+    table = get_user_model()._meta.db_table
+    sql = (
+        f'INSERT INTO "{table}" (password, is_superuser, username, first_name, last_name, '
+        "email, is_staff, is_active, date_joined) "
+        "VALUES ('!', %s, %s, '', '', %s, %s, %s, CURRENT_TIMESTAMP)"
+    )
+    batch = 10000
+    with transaction.atomic(), connection.cursor() as cursor:
+        for lo in range(start, stop, batch):
+            rows = []
+            for i in range(lo, min(lo + batch, stop)):
+                email = f"User{i}@Example.com"
+                rows.append((False, email, email, False, True))
+            cursor.executemany(sql, rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("-n", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from django.db.models import Q
+
+    from apps.accounts.models import with_email_lower
+
+    User = get_user_model()
+    checkpoints = []
+    size = 10_000
+    while size < args.users:
+        checkpoints.append(size)
+        size *= 10
+    checkpoints.append(args.users)
+
+    seeded = 0
+    for size in checkpoints:
+        _seed(seeded, size)
+        seeded = size
+        probe = f"user{size // 2}@example.com"
+
+        def indexed():
+            users = list(
+                with_email_lower(User.objects.select_related("cred", "profile__role"))
+                .filter(Q(email_lower=probe) | Q(username=probe))
+            )
+            assert users
+
+        def iexact():
+            assert User.objects.filter(email__iexact=probe).first()
+
+        report(f"{size:>9,} users  LOWER(email) index", measure(indexed, args.n, 10))
+        report(f"{size:>9,} users  email__iexact", measure(iexact, max(1, args.n // 100), 1))
+
+
+if __name__ == "__main__":
+    main()
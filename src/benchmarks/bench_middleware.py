@@ -0,0 +1,46 @@
+"""JWTAuthMiddleware throughput with and without the decoded-token cache.
+
+    cd src && python -m benchmarks.bench_middleware [-n 20000]
+"""
+import argparse
+
+from .common import measure, report, setup_django
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import RequestFactory
+
+    from apps.accounts import token_cache
+    from apps.accounts.middleware import JWTAuthMiddleware
+    from apps.accounts.stateless import access_claims
+    from apps.accounts.utils import make_access
+
+    user = get_user_model().objects.create(username="bench@local", email="bench@local")
+    middleware = JWTAuthMiddleware(lambda request: None)
+    factory = RequestFactory()
+
+    def run(label, claims):
+        token = make_access(user.id, claims)
+        request = factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        garbage = factory.get("/", HTTP_AUTHORIZATION="Bearer x.y.z")
+        for size in (0, 4096):
+            settings.JWT_DECODE_CACHE_SIZE = size
+            mode = "cached" if size else "uncached"
+            report(f"{label} {mode}", measure(lambda: middleware.process_request(request), args.n))
+            report(f"{label} {mode} garbage", measure(lambda: middleware.process_request(garbage), args.n))
+        print(f"  cache stats: {token_cache.get_token_cache().stats()}")
+
+    run("db user", {})
+    settings.JWT_STATELESS_ACCESS = True
+    run("stateless", access_claims(user))
+
+
+if __name__ == "__main__":
+    main()
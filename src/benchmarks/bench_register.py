@@ -0,0 +1,47 @@
+"""Registrations/sec through POST /api/auth/register, next to the raw KDF costs.
+
+The previous flow paid bcrypt + Django's PBKDF2 per signup; the PBKDF2 line
+shows what each registration no longer spends.
+
+    cd src && python -m benchmarks.bench_register [-n 50] [--rounds 12]
+"""
+import argparse
+import itertools
+
+from .common import measure, report, setup_django
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password
+    from django.test import Client
+
+    from apps.accounts.utils import hash_password
+
+    settings.BCRYPT_ROUNDS = args.rounds
+    report(f"bcrypt hash (rounds={args.rounds})", measure(lambda: hash_password("secret123"), args.n, 2))
+    report("django make_password (PBKDF2)", measure(lambda: make_password("secret123"), args.n, 2))
+
+    client = Client()
+    seq = itertools.count()
+
+    def register():
+        email = f"bench{next(seq)}@local.com"
+        r = client.post(
+            "/api/auth/register",
+            {"email": email, "password": "secret123", "password2": "secret123"},
+            content_type="application/json",
+        )
+        assert r.status_code == 201, r.content
+
+    report("POST /api/auth/register", measure(register, args.n, 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Serializing N goods: GoodSerializer(many=True) vs. the list fast path.
+
+Both sides include the query and JSON rendering, i.e. what a list page costs
+apart from the request plumbing.
+
+    cd src && python -m benchmarks.bench_serializers [--rows 10000 100000] [-n 3]
+"""
+import argparse
+
+from .common import measure, setup_django
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("-n", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.core.fastlist import get_fast_serializer
+    from apps.mock.models import Good
+    from apps.mock.serializers import GoodSerializer
+
+    user = get_user_model().objects.create(username="bench@local", email="bench@local")
+    render = JSONRenderer().render
+    fast = get_fast_serializer(GoodSerializer)
+
+    have = 0
+    for rows in sorted(args.rows):
+        Good.objects.bulk_create(
+            [Good(title=f"good {i}", owner=user) for i in range(have, rows)], batch_size=5000
+        )
+        have = rows
+        qs = Good.objects.order_by("-id")
+
+        def slow():
+            return render(GoodSerializer(qs.all(), many=True).data)
+
+        def quick():
+            return render(fast.to_representation(fast.rows(qs.all())))
+
+        assert slow() == quick()
+        before = measure(slow, args.n, 1)
+        after = measure(quick, args.n, 1)
+        for label, result in (("ModelSerializer", before), ("fast path", after)):
+            print(
+                f"{f'{label} {rows:,} rows':<40} {result['p50_us'] / 1000:>10.1f} ms"
+                f"   {rows * result['ops_per_sec']:>12,.0f} rows/s"
+            )
+        print(f"  speedup x{after['ops_per_sec'] / before['ops_per_sec']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Requests/sec and p99 for GET /api/mock/goods/ through gunicorn on PostgreSQL.
+
+Starts gunicorn (custodia/gunicorn_conf.py, prod settings) once per
+connection mode and drives it with keep-alive HTTP clients:
+
+* per-request: DB_CONN_MAX_AGE=0, a new Postgres connection per request
+* persistent:  DB_CONN_MAX_AGE=60 with health checks
+
+Needs gunicorn and a reachable Postgres (POSTGRES_HOST/PORT/DB/USER/PASSWORD,
+e.g. `docker compose up db` with POSTGRES_HOST=127.0.0.1).
+
+    cd src && python -m benchmarks.bench_serving [-n 5000] [--clients 16] [--workers 2]
+"""
+import argparse
+import http.client
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from .common import SRC
+
+MODES = {
+    "per-request": {"DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_CONN_MAX_AGE": "60"},
+}
+
+
+def _wait_ready(port: int, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/api/auth/whoami")
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("gunicorn did not come up")
+
+
+def _load(port: int, token: str, n: int, clients: int) -> dict:
+    samples, errors = [], []
+    per_client = n // clients
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        headers = {"Authorization": f"Bearer {token}"}
+        local = []
+        for _ in range(per_client):
+            t0 = time.perf_counter()
+            conn.request("GET", "/api/mock/goods/", headers=headers)
+            r = conn.getresponse()
+            r.read()
+            local.append(time.perf_counter() - t0)
+            if r.status != 200:
+                errors.append(r.status)
+        samples.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    total = time.perf_counter() - start
+    samples.sort()
+    return {
+        "rps": len(samples) / total,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": samples[int(len(samples) * 0.99) - 1] * 1000,
+        "errors": len(errors),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    if shutil.which("gunicorn") is None:
+        sys.exit("gunicorn is not installed (pip install -r requirements.txt)")
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = "custodia.settings.prod"
+    os.environ.setdefault("POSTGRES_HOST", "127.0.0.1")
+    from .common import setup_django
+
+    try:
+        setup_django()
+    except Exception as exc:  # no database to talk to
+        sys.exit(f"PostgreSQL is not reachable: {exc}")
+
+    from django.contrib.auth import get_user_model
+
+    from apps.accounts.models import Profile
+    from apps.accounts.utils import make_access
+    from apps.authz.models import Role
+    from apps.mock.models import Good
+
+    user, _ = get_user_model().objects.get_or_create(username="bench@local", email="bench@local")
+    Profile.objects.filter(user=user).update(role=Role.objects.get(code="user"))
+    if not Good.objects.filter(owner=user).exists():
+        Good.objects.bulk_create([Good(title=f"bench {i}", owner=user) for i in range(500)])
+    token = make_access(user.id)
+
+    for mode, env in MODES.items():
+        proc = subprocess.Popen(
+            ["gunicorn", "-c", "custodia/gunicorn_conf.py", "custodia.wsgi"],
+            cwd=SRC,
+            env={
+                **os.environ,
+                **env,
+                "GUNICORN_BIND": f"127.0.0.1:{args.port}",
+                "WEB_CONCURRENCY": str(args.workers),
+                "GUNICORN_THREADS": str(args.threads),
+                "GUNICORN_ACCESS_LOG": "",
+                "GUNICORN_LOG_LEVEL": "warning",
+            },
+        )
+        try:
+            _wait_ready(args.port)
+            _load(args.port, token, min(args.n, 500), args.clients)  # warm-up
+            r = _load(args.port, token, args.n, args.clients)
+            print(
+                f"{mode:<14} {r['rps']:>10,.0f} req/s   p50 {r['p50_ms']:>7.2f} ms"
+                f"   p99 {r['p99_ms']:>7.2f} ms   errors {r['errors']}"
+            )
+        finally:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
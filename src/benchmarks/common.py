@@ -0,0 +1,71 @@
+"""Shared helpers for the offline benchmarks (run from src/: python -m benchmarks.<name>)."""
+import os
+import pathlib
+import statistics
+import time
+
+SRC = pathlib.Path(__file__).resolve().parents[1]
+FIXTURES = sorted(str(p) for p in (SRC / "fixtures").glob("authz_*.json"))
+
+
+def setup_django(migrate: bool = True) -> None:
+    """Configure Django against SQLITE_PATH (default: a private in-memory DB)."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "custodia.settings.dev")
+    os.environ.setdefault("SQLITE_PATH", ":memory:")
+
+    import django
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    # allows the test client's host; DEBUG off means no per-query logging
+    setup_test_environment(debug=False)
+    if migrate:
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+        call_command("loaddata", *FIXTURES, verbosity=0)
+
+
+def measure(fn, n: int, warmup: int = 100) -> dict:
+    """Run fn n times; ops/sec over the whole run plus p50/p99 latency in µs."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(n):
+        t0 = clock()
+        fn()
+        samples.append(clock() - t0)
+    total = clock() - start
+    samples.sort()
+    return {
+        "n": n,
+        "ops_per_sec": n / total,
+        "p50_us": statistics.median(samples) * 1e6,
+        "p99_us": samples[min(n - 1, int(n * 0.99))] * 1e6,
+    }
+
+
+def count_queries(fn) -> int:
+    """Number of SQL queries one call of fn runs."""
+    from django.db import connection
+
+    count = 0
+
+    def wrapper(execute, sql, params, many, context):
+        nonlocal count
+        count += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(wrapper):
+        fn()
+    return count
+
+
+def report(name: str, result: dict) -> None:
+    print(
+        f"{name:<40} {result['ops_per_sec']:>12,.0f} ops/s"
+        f"   p50 {result['p50_us']:>9.1f} µs   p99 {result['p99_us']:>9.1f} µs"
+        + (f"   {result['queries']:>3} q" if "queries" in result else "")
+    )
@@ -0,0 +1,262 @@
+"""Benchmark suite over the auth, RBAC and CRUD hot paths, with JSON results.
+
+    cd src && python -m benchmarks.suite [--only jwt rbac crud] [--sizes 100 10000]
+        [--out results.json] [--baseline old.json] [--threshold 10]
+
+Groups:
+
+* jwt:        make_access / decode_token
+* middleware: JWTAuthMiddleware.process_request, DB-backed and stateless tokens
+* rbac:       RolePermission.has_permission / has_object_permission
+* crud:       list, detail and create of goods and orders through the test
+              client, with the caller owning each of --sizes rows (a "user"
+              sees its own rows, a "manager" lists everyone's)
+* auth:       POST /api/auth/login and /register (cost of CREDENTIAL_HASHERS[0])
+
+Every case reports ops/sec, p50/p99 and the number of queries one call runs.
+--out saves the results together with the environment (Python, Django,
+database, git revision). --baseline compares with such a file and flags cases
+whose throughput dropped by more than --threshold percent or that run more
+queries; the exit status is 1 if any did.
+
+Runs on a private in-memory SQLite by default (SQLITE_PATH for a file). For
+PostgreSQL set DJANGO_SETTINGS_MODULE=custodia.settings.prod and POSTGRES_* to a
+throwaway database: the suite migrates it and writes rows.
+"""
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+from .common import SRC, count_queries, measure, report, setup_django
+
+GROUPS = ("jwt", "middleware", "rbac", "crud", "auth")
+
+
+class Suite:
+    def __init__(self):
+        self.results = {}
+
+    def run(self, name: str, fn, n: int, warmup: int = 100) -> None:
+        result = measure(fn, n, warmup)
+        result["queries"] = count_queries(fn)
+        self.results[name] = result
+        report(name, result)
+
+
+def _user(email: str, role_code: str):
+    from django.contrib.auth import get_user_model
+
+    from apps.accounts.models import Credential, Profile
+    from apps.accounts.utils import hash_password
+    from apps.authz.models import Role
+
+    user = get_user_model().objects.create(username=email, email=email, is_active=True)
+    Credential.objects.create(user=user, password_hash=hash_password("secret123"))
+    Profile.objects.filter(user=user).update(role=Role.objects.get(code=role_code))
+    return user
+
+
+def bench_jwt(suite, args, users):
+    from apps.accounts.utils import decode_token, make_access
+
+    user = users["user"]
+    token = make_access(user.id)
+    suite.run("jwt make_access", lambda: make_access(user.id), args.n)
+    suite.run("jwt decode_token", lambda: decode_token(token), args.n)
+
+
+def bench_middleware(suite, args, users):
+    from django.test import RequestFactory, override_settings
+
+    from apps.accounts.middleware import JWTAuthMiddleware
+    from apps.accounts.stateless import access_claims
+    from apps.accounts.utils import make_access
+
+    user = users["user"]
+    middleware = JWTAuthMiddleware(lambda request: None)
+    factory = RequestFactory()
+    for label, stateless in (("db user", False), ("stateless", True)):
+        with override_settings(JWT_STATELESS_ACCESS=stateless):
+            token = make_access(user.id, access_claims(user))
+            request = factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+            suite.run(f"middleware {label}", lambda: middleware.process_request(request), args.n)
+
+
+def bench_rbac(suite, args, users):
+    from apps.authz.permissions import RolePermission
+    from apps.mock.models import Good
+
+    permission = RolePermission()
+    view = SimpleNamespace(business_element_code="goods")
+    owner = users["user"]
+    good = Good.objects.create(title="rbac", owner=owner)
+    for role, user in users.items():
+        for method in ("GET", "PATCH"):
+            request = SimpleNamespace(user=user, method=method)
+            suite.run(
+                f"rbac has_permission {role} {method}",
+                lambda: permission.has_permission(request, view),
+                args.n,
+            )
+            suite.run(
+                f"rbac has_object_permission {role} {method}",
+                lambda: permission.has_object_permission(request, view, good),
+                args.n,
+            )
+
+
+def bench_crud(suite, args, users):
+    from django.test import Client
+
+    from apps.accounts.utils import make_access
+    from apps.mock.models import Good, Order
+
+    clients = {
+        role: Client(HTTP_AUTHORIZATION=f"Bearer {make_access(user.id)}")
+        for role, user in users.items()
+    }
+    owner = users["user"]
+    seq = itertools.count()
+    resources = (
+        ("goods", Good, lambda i: {"title": f"good {i}"}),
+        ("orders", Order, lambda i: {"number": f"N-{i}"}),
+    )
+
+    def ok(response, status=200):
+        assert response.status_code == status, response.content
+        return response
+
+    for size in sorted(args.sizes):
+        for name, model, payload in resources:
+            have = model.objects.filter(owner=owner).count()
+            model.objects.bulk_create(
+                [model(owner=owner, **payload(i)) for i in range(have, size)], batch_size=5000
+            )
+            url = f"/api/mock/{name}/"
+            detail = f"{url}{model.objects.filter(owner=owner).latest('id').id}/"
+            n, warmup = args.requests, min(args.requests, 20)
+            for role in ("user", "manager"):
+                client = clients[role]
+                suite.run(f"{name} list {role} rows={size}", lambda: ok(client.get(url)), n, warmup)
+            client = clients["user"]
+            suite.run(f"{name} detail rows={size}", lambda: ok(client.get(detail)), n, warmup)
+            suite.run(
+                f"{name} create rows={size}",
+                lambda: ok(client.post(url, payload(next(seq)), content_type="application/json"), 201),
+                n,
+                warmup,
+            )
+
+
+def bench_auth(suite, args, users):
+    from django.test import Client
+
+    client = Client()
+    seq = itertools.count()
+
+    def login():
+        r = client.post(
+            "/api/auth/login",
+            {"email": users["user"].email, "password": "secret123"},
+            content_type="application/json",
+        )
+        assert r.status_code == 200, r.content
+
+    def register():
+        r = client.post(
+            "/api/auth/register",
+            {"email": f"suite{next(seq)}@local.com", "password": "secret123", "password2": "secret123"},
+            content_type="application/json",
+        )
+        assert r.status_code == 201, r.content
+
+    suite.run("auth login", login, args.auth_n, 2)
+    suite.run("auth register", register, args.auth_n, 2)
+
+
+BENCHES = {
+    "jwt": bench_jwt,
+    "middleware": bench_middleware,
+    "rbac": bench_rbac,
+    "crud": bench_crud,
+    "auth": bench_auth,
+}
+
+
+def _environment() -> dict:
+    import django
+    from django.db import connection
+
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SRC, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        revision = ""
+    return {
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "revision": revision or None,
+        "timestamp": int(time.time()),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Print the change against `baseline`; True if any case regressed."""
+    regressed = False
+    print(f"\nagainst baseline (threshold {threshold:g}%):")
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        change = (result["ops_per_sec"] / old["ops_per_sec"] - 1) * 100
+        flags = []
+        if change < -threshold:
+            flags.append("SLOWER")
+        if result["queries"] > old["queries"]:
+            flags.append("MORE QUERIES")
+        regressed = regressed or bool(flags)
+        print(
+            f"{name:<40} {change:>+7.1f}% ops/s   p99 {old['p99_us']:>9.1f} -> {result['p99_us']:>9.1f} µs"
+            f"   q {old['queries']} -> {result['queries']}   {' '.join(flags)}"
+        )
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("-n", type=int, default=5000, help="calls per jwt/middleware/rbac case")
+    parser.add_argument("--requests", type=int, default=300, help="requests per crud case")
+    parser.add_argument("--auth-n", type=int, default=20, help="requests per login/register case")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--out", help="write results as JSON")
+    parser.add_argument("--baseline", help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    users = {role: _user(f"suite-{role}@local.com", role) for role in ("user", "manager")}
+    suite = Suite()
+    for group in GROUPS:
+        if group in args.only:
+            BENCHES[group](suite, args, users)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"environment": _environment(), "results": suite.results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        if compare(suite.results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Gunicorn settings for production, all tunable from the environment.
+
+    cd src && gunicorn -c custodia/gunicorn_conf.py custodia.wsgi   # WSGI, gthread
+    cd src && SERVER_MODE=asgi gunicorn -c custodia/gunicorn_conf.py custodia.asgi
+
+More than one worker refuses to start with a per-process (LocMem) cache:
+RBAC generations, token versions and revocations must be shared.
+
+Persistent database connections are per worker and per thread (gthread), so
+size Postgres max_connections for WEB_CONCURRENCY x GUNICORN_THREADS.
+"""
+import multiprocessing
+import os
+import sys
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "0")) or multiprocessing.cpu_count() * 2 + 1
+
+if os.getenv("SERVER_MODE", "wsgi") == "asgi":
+    worker_class = "uvicorn.workers.UvicornWorker"
+else:
+    worker_class = "gthread"
+    threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# recycle workers now and then to bound slow leaks
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "1000"))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-") or None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+# the password-hash pool, token caches and rule matrix are per process and
+# created lazily, so forking after import is safe
+preload_app = bool(int(os.getenv("GUNICORN_PRELOAD", "0")))
+
+
+def on_starting(server):
+    if server.cfg.workers <= 1:
+        return
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "custodia.settings.dev")
+    from apps.core.checks import process_local_caches
+
+    local = process_local_caches()
+    if local:
+        server.log.error(
+            "%d workers with process-local cache(s) %s: rule changes, token versions and "
+            "revocations would not reach other workers. Configure a shared cache "
+            "(DJANGO_CACHE_BACKEND/DJANGO_CACHE_LOCATION) or set WEB_CONCURRENCY=1.",
+            server.cfg.workers,
+            ", ".join(local),
+        )
+        sys.exit(1)
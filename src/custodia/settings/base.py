@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 
@@ -26,6 +27,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "apps.core.instrumentation.RequestStatsMiddleware",  # off unless sampled
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -36,6 +38,11 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+AUTHENTICATION_BACKENDS = [
+    "apps.accounts.backends.CredentialBackend",
+    "django.contrib.auth.backends.ModelBackend",  # legacy users without Credential
+]
+
 ROOT_URLCONF = "custodia.urls"
 
 TEMPLATES = [
@@ -72,15 +79,68 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
 }
 
+# Keyset pagination of owned-resource lists (apps.core.pagination)
+KEYSET_PAGE_SIZE = int(os.getenv("KEYSET_PAGE_SIZE", "100"))
+KEYSET_MAX_PAGE_SIZE = int(os.getenv("KEYSET_MAX_PAGE_SIZE", "1000"))
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "5000"))
+
+# Per-route query/latency statistics (apps.core.instrumentation): fraction of
+# requests sampled (0 = middleware off) and how often (s) a worker publishes
+# its totals to the cache.
+REQUEST_STATS_SAMPLE_RATE = float(os.getenv("REQUEST_STATS_SAMPLE_RATE", "0"))
+REQUEST_STATS_FLUSH_SEC = float(os.getenv("REQUEST_STATS_FLUSH_SEC", "10"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Custodia API",
     "VERSION": "0.1.0",
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+
+# RBAC rule matrix: cache alias holding the shared rules generation, and how
+# often (ms) a worker compares it with the generation of its local snapshot.
+RBAC_CACHE_ALIAS = os.getenv("RBAC_CACHE_ALIAS", "default")
+RBAC_GENERATION_CHECK_MS = int(os.getenv("RBAC_GENERATION_CHECK_MS", "500"))
+
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-jwt-secret")
 JWT_ALG = os.getenv("JWT_ALG", "HS256")
+# Key ring (apps.accounts.keys): JSON list of {kid, alg, private_key[_file],
+# public_key[_file] | secret}; empty = one HMAC key from JWT_SECRET/JWT_ALG.
+JWT_KEYS = json.loads(os.getenv("JWT_KEYS", "[]"))
+JWT_SIGNING_KID = os.getenv("JWT_SIGNING_KID") or None
+JWKS_MAX_AGE_SEC = int(os.getenv("JWKS_MAX_AGE_SEC", "300"))
 JWT_ACCESS_TTL_MIN = int(os.getenv("JWT_ACCESS_TTL_MIN", "15"))
 JWT_REFRESH_TTL_DAYS = int(os.getenv("JWT_REFRESH_TTL_DAYS", "7"))
+# Access tokens carry role + token version and authenticate without a query
+# (apps.accounts.stateless). Needs a shared cache for prompt revocation.
+JWT_STATELESS_ACCESS = bool(int(os.getenv("JWT_STATELESS_ACCESS", "0")))
+JWT_TOKEN_VERSION_CACHE_SEC = int(os.getenv("JWT_TOKEN_VERSION_CACHE_SEC", "300"))
+# Verified-payload LRU in the middleware (apps.accounts.token_cache); 0 disables.
+JWT_DECODE_CACHE_SIZE = int(os.getenv("JWT_DECODE_CACHE_SIZE", "4096"))
+JWT_DECODE_NEGATIVE_TTL_SEC = float(os.getenv("JWT_DECODE_NEGATIVE_TTL_SEC", "5"))
+
+# Refresh-token revocation store (apps.accounts.revocation)
+REVOCATION_BUCKET_SEC = int(os.getenv("REVOCATION_BUCKET_SEC", "3600"))
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "100000"))
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+
+# Credential hashers (apps.accounts.utils.HASHERS): the first hashes new
+# passwords, the rest are still accepted and upgraded on login.
+CREDENTIAL_HASHERS = os.getenv("CREDENTIAL_HASHERS", "bcrypt").split(",")
+
+# Password hashing (apps.accounts.hashing): bcrypt cost factor, worker threads
+# (0 = CPU count), waiting slots beyond them, Retry-After once both are full.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "16"))
+PASSWORD_HASH_RETRY_AFTER_SEC = int(os.getenv("PASSWORD_HASH_RETRY_AFTER_SEC", "1"))
 
 LOGGING = {
     "version": 1,
@@ -4,6 +4,8 @@ import os
 DEBUG = False
 ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "*").split(",")
 
+_conn_max_age = os.getenv("DB_CONN_MAX_AGE", "60").strip()
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -12,6 +14,18 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD", "custodia"),
         "HOST": os.getenv("POSTGRES_HOST", "db"),
         "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        # keep connections open across requests (seconds; 0 = per request,
+        # empty = forever) and ping them before reuse after an error
+        "CONN_MAX_AGE": int(_conn_max_age) if _conn_max_age else None,
+        "CONN_HEALTH_CHECKS": bool(int(os.getenv("DB_CONN_HEALTH_CHECKS", "1"))),
+    }
+}
+
+# shared by all workers (see apps.core.checks); Redis from compose.yaml
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("DJANGO_CACHE_BACKEND", "django.core.cache.backends.redis.RedisCache"),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "redis://redis:6379/0"),
     }
 }
 
@@ -1,13 +1,16 @@
 from django.contrib import admin
 from django.urls import path, include
+from apps.accounts.views import JWKSView
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path(".well-known/jwks.json", JWKSView.as_view()),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
     path("api/auth/", include("apps.accounts.urls")),
     path("api/authz/", include("apps.authz.urls")),
     path("api/mock/", include("apps.mock.urls")),
+    path("api/core/", include("apps.core.urls")),
 ]
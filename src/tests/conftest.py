@@ -1,13 +1,24 @@
 import pathlib
 import pytest
+from django.core.cache import cache
 from django.core.management import call_command
 from django.contrib.auth import get_user_model
+from django.test import override_settings
 from apps.accounts.models import Credential, Profile
+from apps.accounts.revocation import get_store as get_revocation_store
 from apps.accounts.utils import hash_password, make_access
+from apps.authz import matrix
 from apps.authz.models import Role
 
 User = get_user_model()
 
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hasher():
+    # full-cost bcrypt per fixture user dominates the suite; bcrypt stays
+    # enabled so its hashes still verify
+    with override_settings(CREDENTIAL_HASHERS=["fast", "bcrypt"]):
+        yield
+
 @pytest.fixture(scope="session", autouse=True)
 def _load_base_fixtures(django_db_setup, django_db_blocker):
     here = pathlib.Path(__file__).resolve()
@@ -22,6 +33,16 @@ def _load_base_fixtures(django_db_setup, django_db_blocker):
     with django_db_blocker.unblock():
         call_command("loaddata", *map(str, fixtures))
 
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    # rolled-back test transactions send no signals, so never reuse a snapshot
+    # or cached per-user state (ids are reused across tests)
+    cache.clear()
+    matrix.invalidate()
+    get_revocation_store().reset()
+    yield
+    matrix.invalidate()
+
 @pytest.fixture
 def user(db):
     u = User.objects.create(username="u@test.com", email="u@test.com", is_active=True)
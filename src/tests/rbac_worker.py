@@ -0,0 +1,36 @@
+"""Standalone worker process for the cross-process RBAC coherence test.
+
+    python rbac_worker.py watch <role> <element>   print flags, again per stdin line
+    python rbac_worker.py set <role> <element> <field> <0|1>
+"""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+
+def main(argv):
+    import os
+
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "custodia.settings.dev")
+    django.setup()
+
+    from apps.authz import matrix
+    from apps.authz.models import AccessRoleRule
+
+    cmd, role, element = argv[:3]
+    if cmd == "watch":
+        print(int(matrix.get_rule(role, element) or 0), flush=True)
+        for _ in sys.stdin:
+            print(int(matrix.get_rule(role, element) or 0), flush=True)
+    elif cmd == "set":
+        field, value = argv[3], bool(int(argv[4]))
+        rule = AccessRoleRule.objects.get(role__code=role, element__code=element)
+        setattr(rule, field, value)
+        rule.save()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,67 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client, RequestFactory
+
+from apps.accounts.middleware import JWTAuthMiddleware
+from apps.accounts.utils import make_access, make_refresh
+
+
+def _auth(user) -> dict:
+    return {"headers": {"Authorization": f"Bearer {make_access(user.id)}"}}
+
+
+@pytest.mark.django_db
+def test_async_middleware_uses_async_path(user):
+    async def view(request):
+        return request
+
+    middleware = JWTAuthMiddleware(view)
+    request = async_to_sync(middleware)(RequestFactory().get("/", **_auth(user)))
+    assert request.user.id == user.id and request.role_code == "user"
+
+
+@pytest.mark.django_db
+def test_async_middleware_stateless_token(user, settings):
+    from apps.accounts.stateless import TokenUser, access_claims
+
+    settings.JWT_STATELESS_ACCESS = True
+
+    async def view(request):
+        return request
+
+    token = make_access(user.id, access_claims(user))
+    request = async_to_sync(JWTAuthMiddleware(view))(
+        RequestFactory().get("/", headers={"Authorization": f"Bearer {token}"})
+    )
+    assert isinstance(request.user, TokenUser) and request.role_code == "user"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", ["whoami", "users/me"])
+def test_async_views_match_sync_views(user, path):
+    sync = Client().get(f"/api/auth/{path}", **_auth(user))
+    aio = async_to_sync(AsyncClient().get)(f"/api/auth/aio/{path}", **_auth(user))
+    assert aio.status_code == sync.status_code == 200
+    assert aio.content == sync.content
+
+
+@pytest.mark.django_db
+def test_async_me_requires_authentication():
+    sync = Client().get("/api/auth/users/me")
+    aio = async_to_sync(AsyncClient().get)("/api/auth/aio/users/me")
+    assert aio.status_code == sync.status_code and aio.content == sync.content
+
+
+@pytest.mark.django_db
+def test_async_refresh(user):
+    post = async_to_sync(AsyncClient().post)
+    r = post("/api/auth/aio/refresh", {"refresh": make_refresh(user.id)}, content_type="application/json")
+    assert r.status_code == 200 and r.json()["access"]
+
+    r = post("/api/auth/aio/refresh", {"refresh": make_access(user.id)}, content_type="application/json")
+    assert r.status_code == 400
+
+    user.is_active = False
+    user.save()
+    r = post("/api/auth/aio/refresh", {"refresh": make_refresh(user.id)}, content_type="application/json")
+    assert r.status_code == 401
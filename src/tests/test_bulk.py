@@ -0,0 +1,75 @@
+import pytest
+from rest_framework.test import APIClient
+
+from apps.authz.matrix import get_matrix
+from apps.mock.models import Good, Order
+
+
+@pytest.mark.django_db
+def test_bulk_create_sets_owner_and_reports_ids(user, bearer):
+    c = bearer(APIClient(), user)
+    r = c.post("/api/mock/orders/bulk/", [{"number": f"N-{i}"} for i in range(3)], format="json")
+    assert r.status_code == 201
+    ids = [item["id"] for item in r.data["results"]]
+    assert list(Order.objects.filter(id__in=ids).values_list("owner_id", flat=True).distinct()) == [user.id]
+
+
+@pytest.mark.django_db
+def test_bulk_create_reports_invalid_items(user, bearer):
+    c = bearer(APIClient(), user)
+    r = c.post("/api/mock/goods/bulk/", [{"title": "ok"}, {}], format="json")
+    assert r.status_code == 207
+    assert [item["status"] for item in r.data["results"]] == [201, 400]
+    assert "title" in r.data["results"][1]["errors"]
+    assert Good.objects.filter(owner=user).count() == 1
+
+
+@pytest.mark.django_db
+def test_bulk_update_checks_ownership_per_item(user, manager, bearer, django_assert_max_num_queries):
+    own = Good.objects.create(title="mine", owner=manager)
+    other = Good.objects.create(title="theirs", owner=user)
+    before = own.updated_at
+    c = bearer(APIClient(), manager)  # read_all, but update only on own rows
+    get_matrix()
+
+    # user, one SELECT for the batch, one UPDATE (+ savepoint pair)
+    with django_assert_max_num_queries(5):
+        r = c.patch(
+            "/api/mock/goods/bulk/",
+            [{"id": own.id, "title": "mine2"}, {"id": other.id, "title": "x"}, {"id": 999999, "title": "y"}],
+            format="json",
+        )
+    assert r.status_code == 207
+    assert [item["status"] for item in r.data["results"]] == [200, 403, 404]
+    own.refresh_from_db()
+    other.refresh_from_db()
+    assert own.title == "mine2" and own.updated_at > before
+    assert other.title == "theirs"
+
+
+@pytest.mark.django_db
+def test_bulk_delete(admin, user, bearer):
+    goods = [Good.objects.create(title=str(i), owner=user) for i in range(3)]
+    r = bearer(APIClient(), admin).delete(
+        "/api/mock/goods/bulk/", [g.id for g in goods[:2]], format="json"
+    )
+    assert r.status_code == 200
+    assert list(Good.objects.values_list("id", flat=True)) == [goods[2].id]
+
+
+@pytest.mark.django_db
+def test_bulk_delete_denied_for_whole_batch(user, bearer):
+    g = Good.objects.create(title="x", owner=user)
+    r = bearer(APIClient(), user).delete("/api/mock/goods/bulk/", [g.id], format="json")
+    assert r.status_code == 403
+    assert Good.objects.filter(id=g.id).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_rejects_oversized_batch(user, bearer, settings):
+    settings.BULK_MAX_ITEMS = 2
+    r = bearer(APIClient(), user).post(
+        "/api/mock/goods/bulk/", [{"title": "a"}] * 3, format="json"
+    )
+    assert r.status_code == 400
+    assert not Good.objects.exists()
@@ -0,0 +1,52 @@
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from apps.authz import matrix
+from apps.authz.permissions import RolePermission, check_objects
+from apps.mock.models import Good
+
+
+@pytest.fixture
+def goods(user, manager):
+    matrix.get_matrix()
+    return [Good.objects.create(title=f"g{i}", owner=owner) for i, owner in enumerate((user, manager, user))]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "role, method, expected",
+    [
+        ("user", "GET", [True, False, True]),
+        ("user", "PATCH", [True, False, True]),
+        ("user", "DELETE", [False, False, False]),
+        ("manager", "GET", [True, True, True]),
+        ("manager", "PATCH", [False, True, False]),
+        ("admin", "DELETE", [True, True, True]),
+    ],
+)
+def test_instances_need_no_query(request, goods, role, method, expected, django_assert_num_queries):
+    caller = request.getfixturevalue(role)
+    with django_assert_num_queries(0):
+        assert check_objects(caller, "goods", method, goods, role_code=role) == expected
+
+
+@pytest.mark.django_db
+def test_ids_use_one_owner_query(goods, user, django_assert_num_queries):
+    ids = [g.id for g in goods] + [10**9, None]
+    with django_assert_num_queries(1):
+        result = check_objects(user, "goods", "PATCH", ids, role_code="user", queryset=Good.objects.all())
+    assert result == [True, False, True, None, None]
+
+
+@pytest.mark.django_db
+def test_no_rule_denies_everything(goods, user):
+    assert check_objects(user, "rules", "GET", goods, role_code="user") == [False] * 3
+
+
+@pytest.mark.django_db
+def test_permission_class_batch_matches_single(goods, manager):
+    permission, view = RolePermission(), type("V", (), {"business_element_code": "goods"})()
+    request = APIRequestFactory().patch("/")
+    request.user, request.role_code = manager, "manager"
+    batch = permission.has_objects_permission(request, view, goods)
+    assert batch == [permission.has_object_permission(request, view, g) for g in goods]
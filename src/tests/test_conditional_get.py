@@ -0,0 +1,131 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.authz.models import AccessRoleRule, Role
+from apps.mock.models import Good
+
+
+def _get(client, url, **headers):
+    return client.get(url, **{f"HTTP_{k}": v for k, v in headers.items()})
+
+
+@pytest.mark.django_db
+def test_detail_etag_roundtrip(user, bearer, django_assert_num_queries):
+    g = Good.objects.create(title="G", owner=user)
+    c = bearer(APIClient(), user)
+    url = f"/api/mock/goods/{g.id}/"
+
+    r = c.get(url)
+    assert r.status_code == 200 and r["ETag"].startswith('W/"')
+    assert "Last-Modified" in r and "Authorization" in r["Vary"]
+
+    # user + the object; no serialization on 304
+    with django_assert_num_queries(2):
+        r304 = _get(c, url, IF_NONE_MATCH=r["ETag"])
+    assert r304.status_code == 304 and r304["ETag"] == r["ETag"]
+
+    g.title = "G2"
+    g.save()
+    assert _get(c, url, IF_NONE_MATCH=r["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_list_etag_tracks_rows(user, bearer):
+    Good.objects.create(title="A", owner=user)
+    c = bearer(APIClient(), user)
+    r = c.get("/api/mock/goods/")
+    etag = r["ETag"]
+    assert _get(c, "/api/mock/goods/", IF_NONE_MATCH=etag).status_code == 304
+    assert _get(c, "/api/mock/goods/?page_size=1", IF_NONE_MATCH=etag).status_code == 200
+
+    Good.objects.create(title="B", owner=user)
+    assert _get(c, "/api/mock/goods/", IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_list_etag_tracks_the_page_only(manager, bearer, settings):
+    settings.KEYSET_PAGE_SIZE = 2
+    old, mid, top, newest = (Good.objects.create(title=t, owner=manager) for t in "ABCD")
+    c = bearer(APIClient(), manager)
+    etag = c.get("/api/mock/goods/")["ETag"]
+
+    old.title = "A2"  # not on the first page
+    old.save()
+    assert _get(c, "/api/mock/goods/", IF_NONE_MATCH=etag).status_code == 304
+
+    top.title = "C2"
+    top.save()
+    r = _get(c, "/api/mock/goods/", IF_NONE_MATCH=etag)
+    assert r.status_code == 200
+    etag = r["ETag"]
+
+    newest.delete()  # D drops off, B moves onto the page
+    r = _get(c, "/api/mock/goods/", IF_NONE_MATCH=etag)
+    assert r.status_code == 200 and [g["title"] for g in r.data["results"]] == ["C2", "B"]
+
+
+@pytest.mark.django_db
+def test_list_etag_issues_no_scope_aggregate(manager, bearer):
+    Good.objects.bulk_create([Good(title=f"G{i}", owner=manager) for i in range(30)])
+    c = bearer(APIClient(), manager)
+    etag = c.get("/api/mock/goods/?page_size=5")["ETag"]
+    with CaptureQueriesContext(connection) as ctx:
+        r = _get(c, "/api/mock/goods/?page_size=5", IF_NONE_MATCH=etag)
+    assert r.status_code == 304
+    sql = [q["sql"] for q in ctx.captured_queries if "mock_good" in q["sql"]]
+    assert len(sql) == 1 and "LIMIT 6" in sql[0]
+    assert "COUNT(" not in sql[0] and "MAX(" not in sql[0]
+
+
+@pytest.mark.django_db
+def test_if_modified_since_on_detail(user, bearer):
+    g = Good.objects.create(title="A", owner=user)
+    c = bearer(APIClient(), user)
+    url = f"/api/mock/goods/{g.id}/"
+    r = c.get(url)
+    assert _get(c, url, IF_MODIFIED_SINCE=r["Last-Modified"]).status_code == 304
+    assert _get(c, url, IF_MODIFIED_SINCE="Mon, 01 Jan 2001 00:00:00 GMT").status_code == 200
+
+
+@pytest.mark.django_db
+def test_list_ignores_if_modified_since_after_delete(user, bearer):
+    Good.objects.create(title="A", owner=user)
+    gone = Good.objects.create(title="B", owner=user)
+    c = bearer(APIClient(), user)
+    r = c.get("/api/mock/goods/")
+    assert "Last-Modified" not in r
+    gone.delete()  # MAX(updated_at) stays the same
+    r = _get(c, "/api/mock/goods/", IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+    assert r.status_code == 200 and len(r.data["results"]) == 1
+
+
+@pytest.mark.django_db
+def test_list_ignores_if_modified_since_after_role_change(user, manager, bearer):
+    Good.objects.create(title="M", owner=manager)
+    c = bearer(APIClient(), user)
+    assert c.get("/api/mock/goods/").data["results"] == []
+    profile = user.profile
+    profile.role = Role.objects.get(code="manager")  # older rows come into scope
+    profile.save()
+    c = bearer(APIClient(), user)
+    r = _get(c, "/api/mock/goods/", IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+    assert r.status_code == 200 and len(r.data["results"]) == 1
+
+
+@pytest.mark.django_db
+def test_etag_changes_with_role_scope(user, manager, bearer, django_capture_on_commit_callbacks):
+    Good.objects.create(title="M", owner=manager)
+    c = bearer(APIClient(), manager)
+    etag = c.get("/api/mock/goods/")["ETag"]
+
+    # manager loses read_all: same rows in the table, different scope
+    with django_capture_on_commit_callbacks(execute=True):
+        rule = AccessRoleRule.objects.get(role__code="manager", element__code="goods")
+        rule.read_all_permission = False
+        rule.save()
+    assert _get(c, "/api/mock/goods/", IF_NONE_MATCH=etag).status_code == 200
+
+    # same data, different caller
+    assert _get(bearer(APIClient(), user), "/api/mock/goods/", IF_NONE_MATCH=etag).status_code == 200
@@ -0,0 +1,60 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.core.fastlist import get_fast_serializer
+from apps.mock.models import Good, Order
+from apps.mock.serializers import GoodSerializer, OrderSerializer
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model, serializer_class, text_field",
+    [(Good, GoodSerializer, "title"), (Order, OrderSerializer, "number")],
+)
+def test_fast_serializer_renders_identical_json(user, model, serializer_class, text_field):
+    model.objects.create(owner=user, **{text_field: 'Grüße "quoted" \\  '})
+    model.objects.create(owner=None, **{text_field: ""})
+    odd = model.objects.create(owner=user, **{text_field: "µs"})
+    # microseconds must survive formatting
+    model.objects.filter(pk=odd.pk).update(
+        created_at=datetime.datetime(2024, 2, 29, 23, 59, 59, 123456, tzinfo=datetime.timezone.utc)
+    )
+    qs = model.objects.order_by("-id")
+    fast = get_fast_serializer(serializer_class)
+    assert fast is not None
+
+    renderer = JSONRenderer()
+    expected = renderer.render(serializer_class(qs, many=True).data)
+    assert renderer.render(fast.to_representation(fast.rows(qs))) == expected
+
+    with timezone.override("Asia/Tokyo"):
+        expected = renderer.render(serializer_class(qs, many=True).data)
+        assert renderer.render(fast.to_representation(fast.rows(qs))) == expected
+
+
+def test_unsupported_serializers_fall_back():
+    class WithMethod(GoodSerializer):
+        shout = serializers.SerializerMethodField()
+
+        class Meta(GoodSerializer.Meta):
+            fields = GoodSerializer.Meta.fields + ["shout"]
+
+        def get_shout(self, obj):
+            return obj.title.upper()
+
+    assert get_fast_serializer(WithMethod) is None
+
+
+@pytest.mark.django_db
+def test_list_endpoint_matches_serializer(user, bearer):
+    for i in range(3):
+        Good.objects.create(title=f"G{i}", owner=user)
+    r = bearer(APIClient(), user).get("/api/mock/goods/?page_size=2")
+    page = Good.objects.order_by("-id")[:2]
+    assert r.data["results"] == GoodSerializer(page, many=True).data
+    assert r.data["next"]
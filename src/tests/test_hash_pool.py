@@ -0,0 +1,47 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.accounts import views
+from apps.accounts.hashing import HashPool, HashPoolSaturated
+
+
+def test_pool_rejects_when_workers_and_queue_are_busy():
+    pool = HashPool(workers=1, queue_size=1, retry_after=3)
+    release = threading.Event()
+
+    busy = [threading.Thread(target=pool.run, args=("hash", release.wait, 5)) for _ in range(2)]
+    for t in busy:
+        t.start()
+    # one running, one queued: wait until both have taken their slot
+    deadline = time.monotonic() + 5
+    while pool.in_flight < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    try:
+        with pytest.raises(HashPoolSaturated) as exc:
+            pool.run("hash", lambda: None)
+        assert exc.value.wait == 3 and pool.in_flight == 2
+    finally:
+        release.set()
+        for t in busy:
+            t.join(5)
+
+    assert pool.run("hash", lambda: 42) == 42
+    stats = pool.stats()["ops"]["hash"]
+    assert stats["rejected"] == 1 and stats["count"] == 3
+    pool.shutdown()
+
+
+@pytest.mark.django_db
+def test_login_fails_fast_when_pool_is_saturated(user):
+    saturated = mock.Mock()
+    saturated.run.side_effect = HashPoolSaturated(2)
+    with mock.patch.object(views, "get_hash_pool", return_value=saturated):
+        r = APIClient().post(
+            "/api/auth/login", {"email": "u@test.com", "password": "secret123"}, format="json"
+        )
+    assert r.status_code == 503
+    assert r["Retry-After"] == "2"
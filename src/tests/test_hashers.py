@@ -0,0 +1,55 @@
+import pytest
+from rest_framework.test import APIClient
+
+from apps.accounts.models import Credential
+from apps.accounts.utils import check_password, hash_password, identify_hasher, needs_rehash
+
+
+@pytest.mark.parametrize("name", ["bcrypt", "fast"])
+def test_hasher_roundtrip(name, settings):
+    settings.BCRYPT_ROUNDS = 4
+    hashed = hash_password("secret123", hasher=name)
+    assert identify_hasher(hashed).name == name
+    assert check_password("secret123", hashed)
+    assert not check_password("wrong", hashed)
+
+
+def test_argon2_roundtrip(settings):
+    pytest.importorskip("argon2")
+    settings.CREDENTIAL_HASHERS = ["argon2"]
+    settings.ARGON2_MEMORY_COST = 1024
+    hashed = hash_password("secret123")
+    assert hashed.startswith("$argon2")
+    assert check_password("secret123", hashed)
+    assert not needs_rehash(hashed)
+
+
+def test_disabled_hasher_is_not_accepted(settings):
+    hashed = hash_password("secret123", hasher="fast")
+    settings.CREDENTIAL_HASHERS = ["bcrypt"]
+    assert not check_password("secret123", hashed)
+
+
+def test_needs_rehash_on_cost_or_algorithm_change(settings):
+    settings.CREDENTIAL_HASHERS = ["bcrypt", "fast"]
+    settings.BCRYPT_ROUNDS = 4
+    current = hash_password("secret123")
+    assert not needs_rehash(current)
+    assert needs_rehash(hash_password("secret123", hasher="fast"))
+    settings.BCRYPT_ROUNDS = 5
+    assert needs_rehash(current)
+
+
+@pytest.mark.django_db
+def test_login_rehashes_outdated_credential(user, settings):
+    settings.CREDENTIAL_HASHERS = ["bcrypt", "fast"]
+    settings.BCRYPT_ROUNDS = 4
+    assert identify_hasher(user.cred.password_hash).name == "fast"
+
+    r = APIClient().post(
+        "/api/auth/login", {"email": "u@test.com", "password": "secret123"}, format="json"
+    )
+    assert r.status_code == 200
+    hashed = Credential.objects.get(user=user).password_hash
+    assert hashed.startswith("$2b$04$")
+    assert check_password("secret123", hashed)
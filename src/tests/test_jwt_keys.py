@@ -0,0 +1,109 @@
+import base64
+import hashlib
+import hmac
+
+import jwt
+import pytest
+from rest_framework.test import APIClient
+
+from apps.accounts.keys import get_key_ring
+from apps.accounts.utils import decode_token, make_access
+
+crypto = pytest.importorskip("cryptography")
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa  # noqa: E402
+
+
+def _pem(private) -> str:
+    return private.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture
+def rsa_key():
+    return _pem(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+
+
+@pytest.fixture
+def ed_key():
+    return _pem(ed25519.Ed25519PrivateKey.generate())
+
+
+def test_hmac_default_has_no_kid():
+    token = make_access(1)
+    assert "kid" not in jwt.get_unverified_header(token)
+    assert decode_token(token)["sub"] == "1"
+
+
+def test_rotation_keeps_old_tokens_valid(settings, rsa_key, ed_key):
+    settings.JWT_KEYS = [
+        {"kid": "old", "alg": "RS256", "private_key": rsa_key},
+        {"kid": "new", "alg": "EdDSA", "private_key": ed_key},
+    ]
+    settings.JWT_SIGNING_KID = "old"
+    old_token = make_access(7)
+    assert jwt.get_unverified_header(old_token) == {"alg": "RS256", "kid": "old", "typ": "JWT"}
+
+    settings.JWT_SIGNING_KID = "new"
+    new_token = make_access(7)
+    assert jwt.get_unverified_header(new_token)["kid"] == "new"
+    assert decode_token(old_token)["sub"] == decode_token(new_token)["sub"] == "7"
+
+    settings.JWT_KEYS = settings.JWT_KEYS[1:]
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_token(old_token)
+
+
+def test_algorithm_is_pinned_per_key(settings, rsa_key):
+    settings.JWT_KEYS = [{"kid": "k", "alg": "RS256", "private_key": rsa_key}]
+    public_pem = get_key_ring().by_kid["k"].verifying.public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    # classic confusion: HMAC-sign with the public key as the secret
+    b64 = lambda raw: base64.urlsafe_b64encode(raw).rstrip(b"=")  # noqa: E731
+    signing_input = (
+        b64(b'{"alg":"HS256","kid":"k","typ":"JWT"}')
+        + b"."
+        + b64(b'{"sub":"1","type":"access","exp":9999999999}')
+    )
+    signature = hmac.new(public_pem, signing_input, hashlib.sha256).digest()
+    forged = (signing_input + b"." + b64(signature)).decode()
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_token(forged)
+
+
+def test_pem_is_parsed_once(settings, rsa_key, monkeypatch):
+    settings.JWT_KEYS = [{"kid": "k", "alg": "RS256", "private_key": rsa_key}]
+    token = make_access(1)
+    calls = []
+    original = serialization.load_pem_public_key
+    monkeypatch.setattr(serialization, "load_pem_public_key", lambda *a, **k: calls.append(1) or original(*a, **k))
+    for _ in range(3):
+        decode_token(token)
+    assert calls == []
+
+
+@pytest.mark.django_db
+def test_jwks_endpoint(settings, rsa_key, ed_key):
+    settings.JWT_KEYS = [
+        {"kid": "r", "alg": "RS256", "private_key": rsa_key},
+        {"kid": "e", "alg": "EdDSA", "private_key": ed_key},
+        {"kid": "h", "alg": "HS256", "secret": "s3cret"},
+    ]
+    settings.JWT_SIGNING_KID = "r"
+    c = APIClient()
+    r = c.get("/.well-known/jwks.json")
+    assert r.status_code == 200 and "max-age=300" in r["Cache-Control"]
+    keys = r.json()["keys"]
+    assert {k["kid"] for k in keys} == {"r", "e"}
+    assert all("d" not in k for k in keys)  # no private parts
+
+    # a verifier holding only the JWKS accepts our tokens
+    jwk = next(k for k in keys if k["kid"] == "r")
+    public = jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
+    assert jwt.decode(make_access(3), public, algorithms=["RS256"])["sub"] == "3"
+
+    assert c.get("/api/auth/jwks", HTTP_IF_NONE_MATCH=r["ETag"]).status_code == 304
@@ -0,0 +1,63 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.authz import matrix
+from apps.mock.models import Good
+
+
+@pytest.fixture
+def many_goods(manager):
+    Good.objects.bulk_create(
+        [Good(title=f"G{i}", owner=manager) for i in range(5000)], batch_size=1000
+    )
+
+
+def _page(client, url):
+    matrix.get_matrix()
+    with CaptureQueriesContext(connection) as ctx:
+        r = client.get(url)
+    assert r.status_code == 200
+    return r, [q["sql"] for q in ctx.captured_queries if "mock_good" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_page_n_costs_the_same_as_page_1(manager, many_goods, bearer):
+    c = bearer(APIClient(), manager)
+    r, first_sql = _page(c, "/api/mock/goods/?page_size=50")
+    assert len(r.data["results"]) == 50 and "count" not in r.data
+
+    url, seen, last_sql = r.data["next"], {g["id"] for g in r.data["results"]}, None
+    for _ in range(40):
+        r, last_sql = _page(c, url)
+        ids = [g["id"] for g in r.data["results"]]
+        assert ids == sorted(ids, reverse=True) and not seen.intersection(ids)
+        seen.update(ids)
+        url = r.data["next"]
+
+    assert len(first_sql) == len(last_sql) == 1
+    for sql in (first_sql[0], last_sql[0]):
+        assert "COUNT(" not in sql and "OFFSET" not in sql
+        assert "LIMIT 51" in sql
+    assert '"mock_good"."id" <' in last_sql[0]
+
+
+@pytest.mark.django_db
+def test_page_size_is_capped(manager, many_goods, bearer, settings):
+    settings.KEYSET_MAX_PAGE_SIZE = 20
+    r = bearer(APIClient(), manager).get("/api/mock/goods/?page_size=5000")
+    assert len(r.data["results"]) == 20
+
+
+@pytest.mark.django_db
+def test_walks_to_the_end(user, bearer, settings):
+    settings.KEYSET_PAGE_SIZE = 2
+    Good.objects.bulk_create([Good(title=f"U{i}", owner=user) for i in range(5)])
+    c = bearer(APIClient(), user)
+    url, titles = "/api/mock/goods/", []
+    while url:
+        r = c.get(url)
+        titles += [g["title"] for g in r.data["results"]]
+        url = r.data["next"]
+    assert titles == ["U4", "U3", "U2", "U1", "U0"]
@@ -0,0 +1,43 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.accounts.models import with_email_lower
+
+User = get_user_model()
+
+
+def _login(email, password="secret123"):
+    return APIClient().post("/api/auth/login", {"email": email, "password": password}, format="json")
+
+
+@pytest.mark.django_db
+def test_login_is_case_insensitive(user):
+    assert _login("U@Test.COM").status_code == 200
+
+
+@pytest.mark.django_db
+def test_login_lookup_is_a_single_query(user):
+    with CaptureQueriesContext(connection) as ctx:
+        assert _login("u@test.com").status_code == 200
+    selects = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+    assert len(selects) == 1
+    assert "accounts_credential" in selects[0]
+
+
+@pytest.mark.django_db
+def test_register_rejects_email_differing_only_in_case(user):
+    r = APIClient().post(
+        "/api/auth/register",
+        {"email": "U@test.com", "password": "secret123", "password2": "secret123"},
+        format="json",
+    )
+    assert r.status_code == 400
+
+
+@pytest.mark.django_db
+def test_email_lookup_uses_functional_index():
+    plan = with_email_lower(User.objects).filter(email_lower="u@test.com").explain()
+    assert "accounts_user_email_lower_idx" in plan, plan
@@ -0,0 +1,29 @@
+import pytest
+from django.db import connection
+
+from apps.mock.models import Good, Order
+
+
+def _plan(qs) -> str:
+    if connection.vendor == "postgresql":
+        return qs.explain(analyze=False)
+    return qs.explain()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("model", [Good, Order])
+@pytest.mark.parametrize("order", ["-id", "-created_at"])
+def test_owner_scoped_list_is_served_by_index(model, order, user, manager):
+    model.objects.bulk_create(
+        [model(owner=owner) for owner in (user, manager) for _ in range(200)]
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    qs = model.objects.filter(owner_id=user.id).order_by(order)[:51]
+    plan = _plan(qs)
+    index = f"{model._meta.db_table}_own_{'id' if order == '-id' else 'ca'}_idx"
+    assert index in plan, plan
+    if connection.vendor == "sqlite":
+        assert "TEMP B-TREE" not in plan, plan
+    else:
+        assert "Sort" not in plan and "Seq Scan" not in plan, plan
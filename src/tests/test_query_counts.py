@@ -0,0 +1,30 @@
+import pytest
+from rest_framework.test import APIClient
+
+from apps.authz import matrix
+from apps.mock.models import Good
+
+
+@pytest.fixture
+def good(user):
+    return Good.objects.create(title="U1", owner=user)
+
+
+@pytest.mark.django_db
+def test_goods_detail_get_query_count(user, good, bearer, django_assert_num_queries):
+    c = bearer(APIClient(), user)
+    matrix.get_matrix()
+    # user+profile+role, object
+    with django_assert_num_queries(2):
+        r = c.get(f"/api/mock/goods/{good.id}/")
+    assert r.status_code == 200
+
+
+@pytest.mark.django_db
+def test_goods_detail_patch_query_count(user, good, bearer, django_assert_num_queries):
+    c = bearer(APIClient(), user)
+    matrix.get_matrix()
+    # user+profile+role, object, update
+    with django_assert_num_queries(3):
+        r = c.patch(f"/api/mock/goods/{good.id}/", {"title": "X"}, format="json")
+    assert r.status_code == 200
@@ -0,0 +1,88 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from apps.authz import matrix
+from apps.authz.matrix import Perm
+from apps.authz.models import AccessRoleRule
+
+SRC = pathlib.Path(__file__).resolve().parents[1]
+WORKER = SRC / "tests" / "rbac_worker.py"
+
+
+@pytest.mark.django_db
+@override_settings(RBAC_GENERATION_CHECK_MS=0)
+def test_generation_bump_from_elsewhere_reloads_matrix():
+    assert Perm.READ_ALL not in matrix.get_rule("user", "goods")
+
+    # another worker's write: rows change and the generation moves, but no
+    # signal fires in this process
+    AccessRoleRule.objects.filter(role__code="user", element__code="goods").update(
+        read_all_permission=True
+    )
+    assert Perm.READ_ALL not in matrix.get_rule("user", "goods")
+
+    matrix.bump_generation()
+    assert Perm.READ_ALL in matrix.get_rule("user", "goods")
+
+
+@pytest.mark.django_db
+@override_settings(RBAC_GENERATION_CHECK_MS=60_000)
+def test_generation_is_checked_at_most_once_per_interval(django_assert_num_queries):
+    matrix.get_matrix()
+    matrix.bump_generation()
+    with django_assert_num_queries(0):
+        matrix.get_rule("user", "goods")
+
+
+@pytest.mark.django_db
+def test_rule_save_bumps_generation_on_commit(django_capture_on_commit_callbacks):
+    before = cache.get(matrix.GENERATION_KEY)
+    rule = AccessRoleRule.objects.get(role__code="user", element__code="goods")
+    with django_capture_on_commit_callbacks(execute=True):
+        rule.save()
+        assert cache.get(matrix.GENERATION_KEY) == before
+    assert cache.get(matrix.GENERATION_KEY) != before
+
+
+def _run(args, env, **kwargs):
+    return subprocess.run(
+        [sys.executable, *args], env=env, cwd=SRC, check=True, timeout=120, **kwargs
+    )
+
+
+def test_rule_change_reaches_other_process(tmp_path):
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "custodia.settings.dev",
+        "SQLITE_PATH": str(tmp_path / "db.sqlite3"),
+        "DJANGO_CACHE_BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "DJANGO_CACHE_LOCATION": str(tmp_path / "cache"),
+        "RBAC_GENERATION_CHECK_MS": "0",
+    }
+    fixtures = sorted(str(p) for p in (SRC / "fixtures").glob("authz_*.json"))
+    _run(["manage.py", "migrate", "-v", "0"], env)
+    _run(["manage.py", "loaddata", "-v", "0", *fixtures], env)
+
+    reader = subprocess.Popen(
+        [sys.executable, str(WORKER), "watch", "user", "goods"],
+        env=env, cwd=SRC, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        before = Perm(int(reader.stdout.readline()))
+        assert Perm.READ in before and Perm.READ_ALL not in before
+
+        _run([str(WORKER), "set", "user", "goods", "read_all_permission", "1"], env)
+
+        reader.stdin.write("\n")
+        reader.stdin.flush()
+        after = Perm(int(reader.stdout.readline()))
+        assert Perm.READ_ALL in after
+    finally:
+        reader.stdin.close()
+        reader.wait(timeout=30)
@@ -10,7 +10,7 @@ def test_user_sees_only_own_goods(user, manager, bearer):
     c = bearer(c, user)
     r = c.get("/api/mock/goods/")
     assert r.status_code == 200
-    titles = [x["title"] for x in r.data]
+    titles = [x["title"] for x in r.data["results"]]
     assert "U1" in titles and "M1" not in titles
 
 @pytest.mark.django_db
@@ -22,7 +22,7 @@ def test_manager_reads_all_updates_only_own(user, manager, bearer):
 
     # list: sees both
     r = c.get("/api/mock/goods/")
-    assert r.status_code == 200 and len(r.data) == 2
+    assert r.status_code == 200 and len(r.data["results"]) == 2
 
     # patch own -> 200
     r = c.patch(f"/api/mock/goods/{g_m.id}/", {"title": "OWN"}, format="json")
@@ -0,0 +1,53 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.authz import matrix
+from apps.authz.matrix import Perm
+from apps.authz.models import AccessRoleRule
+from apps.mock.models import Good
+
+
+@pytest.mark.django_db
+def test_matrix_compiles_fixture_rules():
+    m = matrix.get_matrix()
+    assert m.has_element("goods") and not m.has_element("nope")
+    assert m.get("manager", "goods") == Perm.READ | Perm.READ_ALL | Perm.CREATE | Perm.UPDATE
+    assert m.get("user", "rules") is None
+
+
+@pytest.mark.django_db
+def test_rule_lookup_is_query_free_once_loaded():
+    matrix.get_matrix()
+    with CaptureQueriesContext(connection) as ctx:
+        for _ in range(10):
+            matrix.get_rule("user", "goods")
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_rule_change_invalidates_matrix(user, bearer):
+    Good.objects.create(title="U1", owner=user)
+    c = bearer(APIClient(), user)
+    assert c.get("/api/mock/goods/").status_code == 200
+
+    rule = AccessRoleRule.objects.get(role__code="user", element__code="goods")
+    rule.read_permission = False
+    rule.save()
+    assert c.get("/api/mock/goods/").status_code == 403
+
+    rule.delete()
+    assert c.get("/api/mock/goods/").status_code == 403
+    assert matrix.get_rule("user", "goods") is None
+
+
+@pytest.mark.django_db
+def test_admin_api_rule_update_takes_effect(user, admin, bearer):
+    c_user = bearer(APIClient(), user)
+    assert c_user.get("/api/mock/goods/").status_code == 200
+
+    c_admin = bearer(APIClient(), admin)
+    r = c_admin.patch("/api/authz/rules/10/", {"read_permission": False}, format="json")
+    assert r.status_code == 200
+    assert c_user.get("/api/mock/goods/").status_code == 403
@@ -0,0 +1,106 @@
+import datetime as dt
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import RevokedToken
+from apps.accounts.revocation import COUNTER_KEY, BloomFilter, _publish, bucket_for, get_store
+from apps.accounts.utils import decode_token
+
+
+def _login(client) -> dict:
+    r = client.post("/api/auth/login", {"email": "u@test.com", "password": "secret123"}, format="json")
+    assert r.status_code == 200
+    return r.data
+
+
+def _refresh(client, token):
+    return client.post("/api/auth/refresh", {"refresh": token}, format="json")
+
+
+@pytest.mark.django_db
+def test_refresh_rotates_within_family(user):
+    c = APIClient()
+    first = _login(c)["refresh"]
+    r = _refresh(c, first)
+    assert r.status_code == 200
+    second = r.data["refresh"]
+    old, new = decode_token(first), decode_token(second)
+    assert old["fam"] == new["fam"] and old["jti"] != new["jti"]
+    assert _refresh(c, second).status_code == 200
+
+
+@pytest.mark.django_db
+def test_reuse_revokes_the_family(user):
+    c = APIClient()
+    first = _login(c)["refresh"]
+    second = _refresh(c, first).data["refresh"]
+
+    r = _refresh(c, first)  # replayed
+    assert r.status_code == 401
+    assert RevokedToken.objects.filter(key=decode_token(first)["fam"], kind="fam").exists()
+    # the legitimate holder is logged out too
+    assert _refresh(c, second).status_code == 401
+
+
+@pytest.mark.django_db
+def test_logout_revokes_session(user):
+    c = APIClient()
+    refresh = _login(c)["refresh"]
+    assert c.post("/api/auth/logout", {"refresh": refresh}, format="json").status_code == 200
+    assert _refresh(c, refresh).status_code == 401
+
+
+@pytest.mark.django_db
+def test_not_revoked_check_needs_no_query(user, django_assert_num_queries):
+    payload = decode_token(_login(APIClient())["refresh"])
+    store = get_store()
+    store.is_revoked("warm-up")
+    with django_assert_num_queries(0):
+        assert not store.is_revoked(payload["fam"], payload["jti"])
+
+
+@pytest.mark.django_db
+def test_store_picks_up_revocations_from_other_workers(user):
+    store = get_store()
+    assert not store.is_revoked("fam-x")
+    # written by another process: row + counter bump, nothing in our filter
+    expires = timezone.now() + dt.timedelta(days=1)
+    RevokedToken.objects.create(key="fam-x", kind="fam", expires_at=expires, bucket=bucket_for(expires))
+    _publish()
+    assert store.is_revoked("fam-x")
+
+
+@pytest.mark.django_db
+def test_evicted_counter_never_repeats_a_seen_value(user):
+    store = get_store()
+    cache.set(COUNTER_KEY, 1, timeout=None)
+    assert not store.is_revoked("fam-y")  # this worker has seen counter 1
+    cache.delete(COUNTER_KEY)  # evicted
+    expires = timezone.now() + dt.timedelta(days=1)
+    RevokedToken.objects.create(key="fam-y", kind="fam", expires_at=expires, bucket=bucket_for(expires))
+    _publish()
+    assert cache.get(COUNTER_KEY) != 1
+    assert store.is_revoked("fam-y")
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"k{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    assert sum(f"other{i}" in bloom for i in range(10000)) < 300
+
+
+@pytest.mark.django_db
+def test_purge_drops_only_expired_buckets():
+    now = timezone.now()
+    for i, delta in enumerate((-3 * 86400, -7200, 86400)):
+        expires = now + dt.timedelta(seconds=delta)
+        RevokedToken.objects.create(key=f"k{i}", kind="jti", expires_at=expires, bucket=bucket_for(expires))
+    call_command("purge_revoked", "--batch-size", "1")
+    assert list(RevokedToken.objects.values_list("key", flat=True)) == ["k2"]
@@ -0,0 +1,110 @@
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from apps.core import instrumentation
+from apps.core.instrumentation import get_stats, merged_snapshot, report, worker_components
+from apps.mock.models import Good
+
+
+@pytest.fixture
+def sampled():
+    get_stats().reset()
+    with override_settings(REQUEST_STATS_SAMPLE_RATE=1.0, REQUEST_STATS_FLUSH_SEC=3600):
+        yield get_stats()
+    get_stats().reset()
+
+
+@pytest.mark.django_db
+def test_records_queries_per_route(sampled, user, bearer, django_assert_num_queries):
+    Good.objects.create(title="A", owner=user)
+    c = bearer(APIClient(), user)
+    c.get("/api/mock/goods/")  # loads the rule matrix
+    sampled.reset()
+    for _ in range(3):
+        c.get("/api/mock/goods/")
+    with django_assert_num_queries(2):  # user, page
+        c.get("/api/mock/goods/")
+
+    row = sampled.snapshot()["GET mock-goods-list"]
+    assert row["count"] == 4
+    assert row["queries_max"] == 2 and row["queries"] == 8
+    assert row["total_ms"] >= row["db_ms"] and row["render_ms"] > 0
+    assert sum(row["buckets"]) == 4
+
+
+@pytest.mark.django_db
+def test_off_by_default(user, bearer):
+    get_stats().reset()
+    bearer(APIClient(), user).get("/api/mock/goods/")
+    assert get_stats().snapshot() == {}
+
+
+@pytest.mark.django_db
+def test_report_is_staff_only(sampled, user, admin, bearer):
+    bearer(APIClient(), user).get("/api/mock/goods/")
+    assert bearer(APIClient(), user).get("/api/core/request-stats").status_code == 403
+
+    r = bearer(APIClient(), admin).get("/api/core/request-stats?sort=queries&top=1")
+    assert r.status_code == 200
+    assert [row["route"] for row in r.data["routes"]] == ["GET mock-goods-list"]
+    assert bearer(APIClient(), admin).get("/api/core/request-stats?sort=bogus").status_code == 400
+
+
+def test_merge_sums_workers(sampled):
+    sampled.record("GET a", 2, 0.001, 0.004, 0.001)
+    sampled.flush()
+    other = type(sampled)()
+    other.worker = "elsewhere:1"
+    other.record("GET a", 5, 0.002, 0.030, 0.001)
+    other.flush()
+
+    row = merged_snapshot()["GET a"]
+    assert row["count"] == 2 and row["queries"] == 7 and row["queries_max"] == 5
+    [line] = report({"GET a": row})
+    assert line["queries_avg"] == 3.5 and line["p50_ms_le"] == 5 and line["p99_ms_le"] == 50
+
+
+@pytest.mark.django_db
+def test_command_prints_and_resets(sampled, user, bearer, capsys):
+    bearer(APIClient(), user).get("/api/mock/goods/")
+    call_command("request_stats", "--top", "5", "--reset")
+    out = capsys.readouterr().out
+    assert "GET mock-goods-list" in out and "Statistics reset." in out
+    assert merged_snapshot() == {}
+
+
+def test_components_are_published_per_worker(sampled, monkeypatch):
+    monkeypatch.setitem(instrumentation._components, "widget", lambda: {"hits": 3})
+    monkeypatch.setitem(instrumentation._components, "idle", lambda: None)
+    monkeypatch.setitem(instrumentation._components, "broken", lambda: 1 / 0)
+    other = type(sampled)()
+    other.worker = "elsewhere:1"
+    other.flush()
+
+    workers = worker_components()
+    assert workers[sampled.worker]["widget"] == {"hits": 3}
+    assert set(workers[sampled.worker]) == set(workers["elsewhere:1"])
+    assert "idle" not in workers[sampled.worker] and "broken" not in workers[sampled.worker]
+
+
+@pytest.mark.django_db
+def test_token_cache_counters_are_exposed(sampled, user, admin, bearer, capsys):
+    c = bearer(APIClient(), user)
+    c.get("/api/mock/goods/")
+    c.get("/api/mock/goods/")
+    r = bearer(APIClient(), admin).get("/api/core/request-stats")
+    stats = r.data["workers"][sampled.worker]["token_cache"]
+    assert stats["hits"] >= 1 and stats["misses"] >= 1
+
+    call_command("request_stats")
+    assert '  token_cache: {"hits": ' in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+def test_hash_pool_counters_are_exposed(sampled, user, admin, bearer):
+    APIClient().post("/api/auth/login", {"email": user.email, "password": "secret123"}, format="json")
+    r = bearer(APIClient(), admin).get("/api/core/request-stats")
+    pool = r.data["workers"][sampled.worker]["hash_pool"]
+    assert pool["ops"]["check"]["count"] >= 1 and pool["ops"]["check"]["rejected"] == 0
@@ -0,0 +1,127 @@
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from apps.accounts.models import Profile
+from apps.accounts.utils import decode_token
+from apps.authz import matrix
+from apps.authz.matrix import Perm, role_key
+from apps.authz.models import AccessRoleRule, BusinessElement, Role
+from apps.mock.models import Good
+
+
+def _rule(role, element_code, **flags):
+    element = BusinessElement.objects.get(code=element_code)
+    return AccessRoleRule.objects.create(role=role, element=element, **flags)
+
+
+@pytest.fixture
+def auditor(db):
+    role = Role.objects.create(code="auditor", name="Auditor")
+    _rule(role, "goods", read_permission=True, read_all_permission=True)
+    return role
+
+
+@pytest.mark.django_db
+def test_inherits_parent_rules_transitively(django_assert_num_queries):
+    chain = [Role.objects.get(code="manager")]
+    for i in range(20):
+        role = Role.objects.create(code=f"level{i}", name=f"L{i}")
+        role.parents.add(chain[-1])
+        chain.append(role)
+    _rule(chain[-1], "goods", delete_permission=True)
+
+    m = matrix.get_matrix()
+    with django_assert_num_queries(0):
+        flags = m.get("level19", "goods")
+    assert flags == m.get("manager", "goods") | Perm.DELETE
+    assert m.get("level0", "orders") == m.get("manager", "orders")
+    assert m.get("level0", "goods") == m.get("manager", "goods")
+
+
+@pytest.mark.django_db
+def test_parent_rule_change_reaches_children():
+    child = Role.objects.create(code="intern", name="Intern")
+    child.parents.add(Role.objects.get(code="user"))
+    assert Perm.READ in matrix.get_rule("intern", "goods")
+
+    AccessRoleRule.objects.filter(role__code="user", element__code="goods").update(read_permission=False)
+    AccessRoleRule.objects.get(role__code="user", element__code="goods").save()
+    assert Perm.READ not in matrix.get_rule("intern", "goods")
+
+    child.parents.clear()
+    assert matrix.get_rule("intern", "goods") is None
+
+
+@pytest.mark.django_db
+def test_combination_is_or_of_roles(auditor):
+    key = role_key("user", "auditor")
+    assert key == "auditor+user"
+    m = matrix.get_matrix()
+    assert m.get(key, "goods") == m.get("user", "goods") | Perm.READ_ALL
+    assert m.get(key, "orders") == m.get("user", "orders")
+    assert m.get("auditor+nope", "orders") is None
+
+
+@pytest.mark.django_db
+def test_extra_roles_widen_access(user, manager, auditor, bearer, django_assert_num_queries):
+    Good.objects.create(title="mine", owner=user)
+    Good.objects.create(title="theirs", owner=manager)
+    c = bearer(APIClient(), user)
+    assert len(c.get("/api/mock/goods/").data["results"]) == 1
+
+    user.profile.roles.add(auditor)
+    assert Profile.objects.get(user=user).extra_role_codes == "auditor"
+    matrix.get_matrix()
+    # still user+profile+role, page
+    with django_assert_num_queries(2):
+        r = c.get("/api/mock/goods/")
+    assert len(r.data["results"]) == 2
+    # read_all from the auditor, but no write access to others' rows
+    theirs = Good.objects.get(title="theirs")
+    assert c.patch(f"/api/mock/goods/{theirs.id}/", {"title": "x"}, format="json").status_code == 403
+
+    auditor.code = "reviewer"
+    auditor.save()
+    assert Profile.objects.get(user=user).extra_role_codes == "reviewer"
+    auditor.extra_profiles.clear()
+    assert Profile.objects.get(user=user).extra_role_codes == ""
+
+
+@pytest.mark.django_db
+@override_settings(JWT_STATELESS_ACCESS=True)
+def test_role_set_change_expires_stateless_tokens(user, auditor, django_capture_on_commit_callbacks):
+    r = APIClient().post("/api/auth/login", {"email": "u@test.com", "password": "secret123"}, format="json")
+    token = r.data["access"]
+    c = APIClient()
+    c.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert c.get("/api/auth/users/me").status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Profile.objects.get(user=user).roles.add(auditor)
+    assert c.get("/api/auth/users/me").status_code in (401, 403)
+
+    r = APIClient().post("/api/auth/login", {"email": "u@test.com", "password": "secret123"}, format="json")
+    assert decode_token(r.data["access"])["role"] == "auditor+user"
+
+
+@pytest.mark.django_db
+def test_api_rejects_cyclic_inheritance(admin, bearer):
+    c = bearer(APIClient(), admin)
+    r = c.post("/api/authz/roles/", {"code": "lead", "name": "Lead", "parents": ["manager"]}, format="json")
+    assert r.status_code == 201 and r.data["parents"] == ["manager"]
+    manager_id = Role.objects.get(code="manager").id
+    r = c.patch(f"/api/authz/roles/{manager_id}/", {"parents": ["lead"]}, format="json")
+    assert r.status_code == 400
+    r = c.post("/api/authz/roles/", {"code": "a+b", "name": "Bad"}, format="json")
+    assert r.status_code == 400
+
+
+@pytest.mark.django_db
+def test_many_long_extra_roles_fit(user):
+    roles = [Role.objects.create(code=f"{i}" * 50, name=f"R{i}") for i in range(8)]
+    profile = Profile.objects.get(user=user)
+    profile.roles.add(*roles)
+    stored = Profile.objects.get(user=user).extra_role_codes
+    assert len(stored) > 255 and stored == role_key(*(r.code for r in roles))
+    assert Profile._meta.get_field("extra_role_codes").max_length is None
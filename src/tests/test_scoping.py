@@ -0,0 +1,87 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Max
+from rest_framework.test import APIClient
+
+from apps.authz import matrix
+from apps.authz.models import AccessRoleRule
+from apps.core.scoping import visibility_q
+from apps.mock.models import Good, Order
+
+User = get_user_model()
+
+# (role fixture, rows of each model it sees of the 3 created by `rows`)
+ROLES = [("user", 1), ("manager", 3), ("admin", 3)]
+
+
+@pytest.fixture
+def rows(user, manager, admin):
+    for owner in (user, manager, admin):
+        Good.objects.create(title=f"g-{owner.id}", owner=owner)
+        Order.objects.create(number=f"o-{owner.id}", owner=owner)
+    matrix.get_matrix()
+
+
+def _loaded(u):
+    # as JWTAuthMiddleware loads it: profile and role joined in
+    return User.objects.select_related("profile__role").get(pk=u.pk)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("role, visible", ROLES)
+def test_count_and_aggregate_one_query_each(request, rows, role, visible, django_assert_num_queries):
+    u = _loaded(request.getfixturevalue(role))
+    with django_assert_num_queries(1):
+        assert Good.objects.visible_to(u, "goods").count() == visible
+    with django_assert_num_queries(1):
+        agg = Order.objects.visible_to(u, "orders").aggregate(n=Count("id"), top=Max("id"))
+    assert agg["n"] == visible
+    with django_assert_num_queries(1):
+        titles = list(
+            Good.objects.visible_to(u, "goods").filter(title__startswith="g-").values_list("title", flat=True)
+        )
+    assert len(titles) == visible
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("role, visible", ROLES)
+def test_api_list_query_count(request, rows, bearer, role, visible, django_assert_num_queries):
+    c = bearer(APIClient(), request.getfixturevalue(role))
+    for url in ("/api/mock/goods/", "/api/mock/orders/"):
+        # user+profile+role, page
+        with django_assert_num_queries(2):
+            r = c.get(url)
+        assert r.status_code == 200 and len(r.data["results"]) == visible
+
+
+@pytest.mark.django_db
+def test_no_rule_sees_nothing_without_query(rows, user, django_assert_num_queries):
+    u = _loaded(user)
+    with django_assert_num_queries(0):
+        assert list(Good.objects.visible_to(u, "rules")) == []
+        assert Good.objects.visible_to(u, "goods", role_code="nobody").count() == 0
+
+
+@pytest.mark.django_db
+def test_prefix_scopes_through_a_relation(rows, user, manager):
+    u = _loaded(user)
+    # owners of orders the user may read, filtered across the reverse FK
+    owners = User.objects.filter(visibility_q(u, "orders", prefix="mock_order_owned__"))
+    assert list(owners.values_list("id", flat=True)) == [user.id]
+    hidden = User.objects.filter(visibility_q(u, "rules", prefix="mock_order_owned__"))
+    assert not hidden.exists()
+
+
+@pytest.mark.django_db
+def test_write_only_rule_still_reaches_own_rows(user, bearer):
+    AccessRoleRule.objects.filter(role__code="user", element__code="goods").update(
+        read_permission=False, update_permission=True, delete_permission=True
+    )
+    mine = Good.objects.create(title="mine", owner=user)
+    other = Good.objects.create(title="gone", owner=user)
+    c = bearer(APIClient(), user)
+    assert c.get("/api/mock/goods/").status_code == 403
+    assert c.patch(f"/api/mock/goods/{mine.id}/", {"title": "x"}, format="json").status_code == 200
+    r = c.patch("/api/mock/goods/bulk/", [{"id": mine.id, "title": "y"}], format="json")
+    assert r.status_code == 200
+    assert c.delete(f"/api/mock/goods/{other.id}/").status_code == 204
@@ -0,0 +1,50 @@
+from collections import Counter
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APIClient
+
+from apps.accounts.models import Profile
+from apps.mock.models import Good, Order
+
+User = get_user_model()
+
+
+def _seed(*args):
+    call_command(
+        "seed_demo", "--hasher", "fast", "--users", "30", "--goods-per-user", "4",
+        "--orders-per-user", "2", "--batch-size", "7", *args, stdout=open("/dev/null", "w"),
+    )
+
+
+@pytest.mark.django_db
+def test_synthetic_users_and_rows():
+    _seed("--roles", "user", "manager", "--skew", "1.2", "--seed", "3")
+    generated = User.objects.filter(username__endswith="@seed3.test")
+    assert generated.count() == 30
+    roles = Profile.objects.filter(user__in=generated).values_list("role__code", flat=True)
+    assert sorted(set(roles)) == ["manager", "user"] and list(roles).count("manager") == 15
+    goods = Good.objects.filter(owner__in=generated)
+    assert goods.count() == 120 and Order.objects.filter(owner__in=generated).count() == 60
+    # skewed: the busiest owner holds far more than the mean of 4
+    [(_, busiest)] = Counter(goods.values_list("owner_id", flat=True)).most_common(1)
+    assert busiest > 12
+
+    r = APIClient().post(
+        "/api/auth/login", {"email": "load0@seed3.test", "password": "secret123"}, format="json"
+    )
+    assert r.status_code == 200
+
+
+@pytest.mark.django_db
+def test_seeding_is_deterministic_and_guarded():
+    _seed("--skew", "1", "--seed", "5")
+    owners = list(Good.objects.order_by("id").values_list("owner__username", flat=True))
+    with pytest.raises(CommandError):
+        _seed("--seed", "5")
+    Good.objects.all().delete()
+    User.objects.filter(username__endswith="@seed5.test").delete()
+    _seed("--skew", "1", "--seed", "5")
+    assert list(Good.objects.order_by("id").values_list("owner__username", flat=True)) == owners
@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+import pytest
+from django.test import override_settings
+
+from apps.core.checks import check_shared_cache, process_local_caches
+from custodia import gunicorn_conf
+
+REDIS = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://x"}}
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def _server(workers):
+    errors = []
+    return SimpleNamespace(cfg=SimpleNamespace(workers=workers), log=SimpleNamespace(error=lambda *a: errors.append(a))), errors
+
+
+def test_locmem_is_flagged():
+    with override_settings(CACHES=LOCMEM):
+        assert process_local_caches() == ["default"]
+        assert [w.id for w in check_shared_cache(None)] == ["core.W001"]
+    with override_settings(CACHES=REDIS):
+        assert process_local_caches() == [] and check_shared_cache(None) == []
+
+
+def test_gunicorn_refuses_several_workers_on_locmem():
+    server, errors = _server(4)
+    with override_settings(CACHES=LOCMEM), pytest.raises(SystemExit):
+        gunicorn_conf.on_starting(server)
+    assert errors
+
+    with override_settings(CACHES=LOCMEM):
+        gunicorn_conf.on_starting(_server(1)[0])
+    with override_settings(CACHES=REDIS):
+        gunicorn_conf.on_starting(_server(4)[0])
@@ -0,0 +1,63 @@
+import pytest
+from django.contrib.auth import authenticate, get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.accounts.utils import get_hasher
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_register_writes_one_hash_and_one_user_insert():
+    with CaptureQueriesContext(connection) as ctx:
+        r = APIClient().post(
+            "/api/auth/register",
+            {"email": "new@test.com", "password": "secret123", "password2": "secret123"},
+            format="json",
+        )
+    assert r.status_code == 201
+    user_writes = [
+        q["sql"] for q in ctx.captured_queries
+        if q["sql"].startswith(("INSERT", "UPDATE")) and '"auth_user"' in q["sql"].split("(")[0]
+    ]
+    assert len(user_writes) == 1 and user_writes[0].startswith("INSERT")
+
+    user = User.objects.select_related("cred", "profile").get(email="new@test.com")
+    assert not user.has_usable_password()
+    assert get_hasher().matches(user.cred.password_hash)
+    assert user.profile.role.code == "user"
+
+
+@pytest.mark.django_db
+def test_legacy_user_is_moved_to_credential_on_login():
+    legacy = User.objects.create_user("old@test.com", "old@test.com", "secret123")
+    r = APIClient().post(
+        "/api/auth/login", {"email": "old@test.com", "password": "secret123"}, format="json"
+    )
+    assert r.status_code == 200
+    legacy = User.objects.select_related("cred").get(pk=legacy.pk)
+    assert not legacy.has_usable_password()
+    assert get_hasher().matches(legacy.cred.password_hash)
+
+    r = APIClient().post(
+        "/api/auth/login", {"email": "old@test.com", "password": "secret123"}, format="json"
+    )
+    assert r.status_code == 200
+
+
+@pytest.mark.django_db
+def test_wrong_password_is_not_retried_against_django_hash(user):
+    user.set_password("other-password")
+    user.save(update_fields=["password"])
+    r = APIClient().post(
+        "/api/auth/login", {"email": "u@test.com", "password": "other-password"}, format="json"
+    )
+    assert r.status_code == 400
+
+
+@pytest.mark.django_db
+def test_admin_login_backend_uses_credential(admin):
+    assert authenticate(username="a@test.com", password="secret123") == admin
+    assert authenticate(username="a@test.com", password="nope") is None
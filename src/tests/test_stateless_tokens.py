@@ -0,0 +1,92 @@
+import jwt
+import pytest
+from django.conf import settings
+from rest_framework.test import APIClient
+
+from apps.accounts.utils import decode_token
+from apps.authz import matrix
+from apps.authz.models import Role
+from apps.mock.models import Good
+
+
+@pytest.fixture(autouse=True)
+def _stateless(settings):
+    settings.JWT_STATELESS_ACCESS = True
+
+
+def _login(client, email="u@test.com"):
+    r = client.post("/api/auth/login", {"email": email, "password": "secret123"}, format="json")
+    assert r.status_code == 200
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {r.data['access']}")
+    return r.data["access"]
+
+
+@pytest.mark.django_db
+def test_access_token_carries_role_and_version(user):
+    payload = decode_token(_login(APIClient()))
+    assert payload["role"] == "user"
+    assert payload["tv"] == user.profile.token_version
+
+
+@pytest.mark.django_db
+def test_authenticated_list_needs_no_user_query(user, django_assert_num_queries):
+    Good.objects.create(title="U1", owner=user)
+    c = APIClient()
+    _login(c)
+    c.get("/api/mock/goods/")  # warm the version map and rule matrix
+    matrix.get_matrix()
+    # the page only; nothing for the user
+    with django_assert_num_queries(1):
+        r = c.get("/api/mock/goods/")
+    assert r.status_code == 200 and [g["title"] for g in r.data["results"]] == ["U1"]
+
+
+@pytest.mark.django_db
+def test_create_and_me_work_with_token_user(user):
+    c = APIClient()
+    _login(c)
+    r = c.post("/api/mock/goods/", {"title": "New"}, format="json")
+    assert r.status_code == 201 and r.data["owner"] == user.id
+    r = c.patch("/api/auth/users/me", {"first_name": "Ann"}, format="json")
+    assert r.status_code == 200 and r.data["first_name"] == "Ann"
+
+
+@pytest.mark.django_db
+def test_deactivation_revokes_token(user, django_capture_on_commit_callbacks):
+    c = APIClient()
+    _login(c)
+    assert c.get("/api/auth/users/me").status_code == 200
+    with django_capture_on_commit_callbacks(execute=True):
+        assert c.delete("/api/auth/users/me").status_code == 204
+    assert c.get("/api/auth/users/me").status_code in (401, 403)
+
+
+@pytest.mark.django_db
+def test_role_change_revokes_token(user, django_capture_on_commit_callbacks):
+    c = APIClient()
+    _login(c)
+    assert c.get("/api/mock/goods/").status_code == 200
+    with django_capture_on_commit_callbacks(execute=True):
+        profile = user.profile
+        profile.role = Role.objects.get(code="manager")
+        profile.save()
+    assert c.get("/api/mock/goods/").status_code in (401, 403)
+
+    payload = decode_token(_login(c))
+    assert payload["role"] == "manager"
+    assert c.get("/api/mock/goods/").status_code == 200
+
+
+@pytest.mark.django_db
+def test_token_without_version_claim_uses_database(user, bearer):
+    c = bearer(APIClient(), user)
+    assert c.get("/api/auth/users/me").data["email"] == "u@test.com"
+
+    forged = jwt.encode(
+        {**decode_token(_login(APIClient())), "tv": 999},
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALG,
+    )
+    c.credentials(HTTP_AUTHORIZATION=f"Bearer {forged}")
+    assert c.get("/api/auth/users/me").status_code in (401, 403)
+
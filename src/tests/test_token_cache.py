@@ -0,0 +1,70 @@
+import time
+from unittest import mock
+
+import jwt
+import pytest
+from django.conf import settings
+from rest_framework.test import APIClient
+
+from apps.accounts import token_cache
+from apps.accounts.token_cache import DecodedTokenCache
+from apps.accounts.utils import make_access, make_token
+
+
+def test_valid_token_is_verified_once():
+    cache = DecodedTokenCache(maxsize=8)
+    token = make_access(1)
+    with mock.patch.object(token_cache, "decode_token", wraps=token_cache.decode_token) as dec:
+        first = cache.decode(token)
+        second = cache.decode(token)
+    assert dec.call_count == 1
+    assert first is second and first["sub"] == "1"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_garbage_tokens_are_negatively_cached():
+    cache = DecodedTokenCache(maxsize=8, negative_ttl=60)
+    for _ in range(3):
+        with pytest.raises(jwt.InvalidTokenError):
+            cache.decode("not-a-jwt")
+    stats = cache.stats()
+    assert stats["misses"] == 1 and stats["negative_hits"] == 2
+
+
+def test_entry_expires_with_token():
+    cache = DecodedTokenCache(maxsize=8)
+    token = make_token(1, ttl_minutes=1)
+    payload = cache.decode(token)
+    with mock.patch("time.time", return_value=payload["exp"]):
+        cache.decode(token)  # re-verified, not served past exp
+    assert cache.stats()["misses"] == 2 and cache.stats()["hits"] == 0
+
+
+def test_lru_is_bounded():
+    cache = DecodedTokenCache(maxsize=2)
+    tokens = [make_access(i) for i in range(1, 4)]
+    for t in tokens:
+        cache.decode(t)
+    assert cache.stats()["size"] == 2
+    cache.decode(tokens[0])
+    assert cache.stats()["misses"] == 4
+
+
+def test_forged_signature_is_not_served_from_cache():
+    cache = DecodedTokenCache(maxsize=8)
+    payload = {"sub": "1", "type": "access", "exp": int(time.time()) + 60}
+    good = jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALG)
+    forged = jwt.encode(payload, "other-secret", algorithm=settings.JWT_ALG)
+    cache.decode(good)
+    with pytest.raises(jwt.InvalidSignatureError):
+        cache.decode(forged)
+
+
+@pytest.mark.django_db
+def test_middleware_uses_cache(user, bearer, settings):
+    settings.JWT_DECODE_CACHE_SIZE = 16
+    c = bearer(APIClient(), user)
+    assert c.get("/api/auth/users/me").status_code == 200
+    hits = token_cache.get_token_cache().hits
+    assert c.get("/api/auth/users/me").status_code == 200
+    assert token_cache.get_token_cache().hits == hits + 1